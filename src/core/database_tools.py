@@ -16,6 +16,23 @@ from datetime import datetime
 from contextlib import contextmanager
 
 
+# Leading keywords of statements that only read. WITH is not among them:
+# the statement after a CTE may be a DELETE, UPDATE or INSERT.
+_READ_KEYWORDS = frozenset({"SELECT", "PRAGMA", "EXPLAIN"})
+
+
+def _is_read_statement(sql: str) -> bool:
+    """Check whether a statement only reads by looking at its first keyword."""
+    length = len(sql)
+    start = 0
+    while start < length and sql[start].isspace():
+        start += 1
+    end = start
+    while end < length and sql[end].isalpha():
+        end += 1
+    return sql[start:end].upper() in _READ_KEYWORDS
+
+
 @dataclass
 class QueryResult:
     """Result of a database query."""
@@ -38,7 +55,7 @@ class TableInfo:
     indexes: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class DatabaseConnection:
     """A database connection configuration."""
     name: str
@@ -47,12 +64,8 @@ class DatabaseConnection:
     created_at: str = ""
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "name": self.name,
-            "type": self.type,
-            "connection_string": self.connection_string,
-            "created_at": self.created_at,
-        }
+        # All fields are primitives, so a shallow read of the slots is enough.
+        return {name: getattr(self, name) for name in self.__slots__}
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "DatabaseConnection":
@@ -146,6 +159,20 @@ class DatabaseTools:
         finally:
             conn.close()
 
+    def _resolve_connection(
+        self, connection_name: Optional[str] = None
+    ) -> Optional[DatabaseConnection]:
+        """Look up a named connection, falling back to the active one."""
+        if connection_name:
+            return self.connections.get(connection_name)
+        return self.active_connection
+
+    @contextmanager
+    def _with_conn(self, conn_config: DatabaseConnection):
+        """Open a raw SQLite connection for a connection config."""
+        with self._get_sqlite_connection(conn_config.connection_string) as conn:
+            yield conn
+
     def query(
         self,
         sql: str,
@@ -167,10 +194,7 @@ class DatabaseTools:
         start_time = time.time()
 
         # Get connection
-        if connection_name:
-            conn_config = self.connections.get(connection_name)
-        else:
-            conn_config = self.active_connection
+        conn_config = self._resolve_connection(connection_name)
 
         if not conn_config:
             return QueryResult(
@@ -185,23 +209,29 @@ class DatabaseTools:
             if conn_config.type == "sqlite":
                 with self._get_sqlite_connection(conn_config.connection_string) as conn:
                     cursor = conn.cursor()
+                    changes_before = conn.total_changes
 
                     if params:
                         cursor.execute(sql, params)
                     else:
                         cursor.execute(sql)
 
-                    # Check if it's a SELECT query
-                    sql_upper = sql.strip().upper()
-                    if sql_upper.startswith("SELECT") or sql_upper.startswith("PRAGMA"):
+                    # Collect rows from anything that returns them,
+                    # including WITH ... SELECT and ... RETURNING
+                    if cursor.description is not None:
                         rows = cursor.fetchall()
                         if rows:
                             result.columns = list(rows[0].keys())
                             result.rows = [dict(row) for row in rows]
                             result.row_count = len(rows)
-                    else:
+                    if not _is_read_statement(sql):
                         conn.commit()
-                        result.affected_rows = cursor.rowcount
+                        # sqlite3 reports rowcount -1 for DML behind a WITH
+                        # clause; count the connection's changes instead
+                        if cursor.rowcount >= 0:
+                            result.affected_rows = cursor.rowcount
+                        else:
+                            result.affected_rows = conn.total_changes - changes_before
 
             else:
                 result.success = False
@@ -231,38 +261,42 @@ class DatabaseTools:
         connection_name: Optional[str] = None,
     ) -> Optional[TableInfo]:
         """Get information about a table."""
-        # Get columns
-        columns_result = self.query(
-            f"PRAGMA table_info({table_name})",
-            connection_name=connection_name,
-        )
+        conn_config = self._resolve_connection(connection_name)
+        if not conn_config or conn_config.type != "sqlite":
+            return None
 
-        if not columns_result.success:
+        # Run all metadata queries on a single connection instead of
+        # going through query() three times.
+        try:
+            with self._with_conn(conn_config) as conn:
+                cursor = conn.cursor()
+                cursor.execute(f"PRAGMA table_info({table_name})")
+                column_rows = cursor.fetchall()
+
+                try:
+                    cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
+                    row_count = cursor.fetchone()[0]
+                except sqlite3.Error:
+                    row_count = 0
+
+                try:
+                    cursor.execute(f"PRAGMA index_list({table_name})")
+                    indexes = [row["name"] for row in cursor.fetchall()]
+                except sqlite3.Error:
+                    indexes = []
+        except sqlite3.Error:
             return None
 
-        columns = []
-        for row in columns_result.rows:
-            columns.append({
+        columns = [
+            {
                 "name": row["name"],
                 "type": row["type"],
                 "nullable": not row["notnull"],
                 "default": row["dflt_value"],
                 "primary_key": bool(row["pk"]),
-            })
-
-        # Get row count
-        count_result = self.query(
-            f"SELECT COUNT(*) as count FROM {table_name}",
-            connection_name=connection_name,
-        )
-        row_count = count_result.rows[0]["count"] if count_result.success and count_result.rows else 0
-
-        # Get indexes
-        index_result = self.query(
-            f"PRAGMA index_list({table_name})",
-            connection_name=connection_name,
-        )
-        indexes = [row["name"] for row in index_result.rows] if index_result.success else []
+            }
+            for row in column_rows
+        ]
 
         return TableInfo(
             name=table_name,
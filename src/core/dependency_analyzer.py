@@ -7,17 +7,79 @@ Analyze project dependencies:
 - Dependency upgrades
 """
 
+import ast
+import os
 import re
+import sys
 import json
 from pathlib import Path
 from typing import Optional, List, Dict, Any, Set, Tuple
 from dataclasses import dataclass, field
-from collections import defaultdict
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 
 from src.config.settings import get_settings
 
 
-@dataclass
+# Directories never descended into when looking for source files
+_IGNORED_DIRS = frozenset({'node_modules', '__pycache__', 'venv', '.venv', 'dist', 'build'})
+
+# Last analysis per working directory: path -> (tree stamp, graph); only
+# the most recently used directories are kept
+_analysis_cache: Dict[str, Tuple[Tuple[int, int, int], "DependencyGraph"]] = {}
+_ANALYSIS_CACHE_MAX = 8
+
+
+def invalidate_cache():
+    """Forget all memoized dependency analyses."""
+    _analysis_cache.clear()
+
+
+# Identifiers inside string (forward reference) annotations
+_IDENTIFIER_RE = re.compile(r'[A-Za-z_]\w*')
+
+
+def _scan_tree(tree: ast.AST) -> Tuple[List[ast.stmt], Counter]:
+    """Collect import statements and identifier counts in one walk.
+
+    Import statements contribute their own names once, so an imported name
+    with a count of one is never referenced elsewhere. Names inside quoted
+    annotations such as ``"Dict[str, Tuple[int, int]]"`` count as uses.
+    """
+    import_nodes: List[ast.stmt] = []
+    annotations: List[ast.expr] = []
+    counts: Counter = Counter()
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.arg, ast.AnnAssign)):
+            if node.annotation is not None:
+                annotations.append(node.annotation)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            if node.returns is not None:
+                annotations.append(node.returns)
+
+        if isinstance(node, ast.Name):
+            counts[node.id] += 1
+        elif isinstance(node, ast.Attribute):
+            counts[node.attr] += 1
+        elif isinstance(node, ast.alias):
+            counts.update(node.name.split('.'))
+            if node.asname:
+                counts[node.asname] += 1
+        elif isinstance(node, ast.Import):
+            import_nodes.append(node)
+        elif isinstance(node, ast.ImportFrom):
+            import_nodes.append(node)
+            if node.module:
+                counts.update(node.module.split('.'))
+
+    for annotation in annotations:
+        for node in ast.walk(annotation):
+            if isinstance(node, ast.Constant) and isinstance(node.value, str):
+                counts.update(_IDENTIFIER_RE.findall(node.value))
+    return import_nodes, counts
+
+
+@dataclass(slots=True)
 class ImportInfo:
     """Information about an import."""
     module: str
@@ -27,7 +89,7 @@ class ImportInfo:
     is_relative: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class FileImports:
     """Imports for a single file."""
     file_path: str
@@ -37,20 +99,28 @@ class FileImports:
     local: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class DependencyGraph:
     """Full dependency graph for the project."""
     files: Dict[str, FileImports] = field(default_factory=dict)
-    edges: List[Tuple[str, str]] = field(default_factory=list)  # (from_file, to_module)
+    # Import edges as parallel lists: edge_src[i] (file) imports edge_dst[i] (module)
+    edge_src: List[str] = field(default_factory=list)
+    edge_dst: List[str] = field(default_factory=list)
     circular: List[List[str]] = field(default_factory=list)
     unused: Dict[str, List[str]] = field(default_factory=dict)
 
+    @property
+    def edges(self) -> List[Tuple[str, str]]:
+        """Import edges as (from_file, to_module) pairs."""
+        return list(zip(self.edge_src, self.edge_dst))
+
 
 class DependencyAnalyzer:
     """Analyze project dependencies."""
 
-    # Python standard library modules (common ones)
-    STDLIB_MODULES = {
+    # Python standard library modules (common ones), used when the
+    # interpreter does not provide sys.stdlib_module_names
+    STDLIB_MODULES = frozenset({
         'abc', 'aifc', 'argparse', 'array', 'ast', 'asyncio', 'atexit',
         'base64', 'bdb', 'binascii', 'binhex', 'bisect', 'builtins',
         'calendar', 'cgi', 'cgitb', 'chunk', 'cmath', 'cmd', 'code',
@@ -83,232 +153,354 @@ class DependencyAnalyzer:
         'uu', 'uuid', 'venv', 'warnings', 'wave', 'weakref', 'webbrowser',
         'winreg', 'winsound', 'wsgiref', 'xdrlib', 'xml', 'xmlrpc', 'zipapp',
         'zipfile', 'zipimport', 'zlib', '_thread', '__future__',
-    }
+    })
 
     def __init__(self, working_dir: Optional[Path] = None):
         """Initialize analyzer."""
         self.working_dir = working_dir or Path.cwd()
         self.graph = DependencyGraph()
+        # Identifier counts per file, collected while parsing in analyze()
+        self._name_counts: Dict[str, Counter] = {}
+        # Line numbers carrying a '# noqa' marker, per file
+        self._noqa_lines: Dict[str, Set[int]] = {}
+        # Dotted module name -> file path for every analyzed file
+        self._module_index: Dict[str, str] = {}
+        # Absolute file path -> path relative to working_dir, for display
+        self._rel_paths: Dict[str, str] = {}
 
     def analyze(self) -> DependencyGraph:
         """
         Analyze all dependencies in the project.
 
+        While no source file changes, repeated calls for the same working
+        directory return the same cached graph object. Treat it as
+        read-only; copy.deepcopy() it before modifying.
+
         Returns:
             DependencyGraph with all analysis results
         """
-        self.graph = DependencyGraph()
-
-        # Find all Python files
-        py_files = list(self.working_dir.rglob('*.py'))
+        # Find all Python files, skipping ignored directories
+        py_files = list(self._iter_py_files(self.working_dir))
+        self._rel_paths = {
+            str(py_file): str(py_file.relative_to(self.working_dir)) for py_file in py_files
+        }
+
+        # Reuse the previous result if no source file changed since
+        cache_key = str(self.working_dir)
+        stamp = self._tree_stamp(py_files)
+        cached = _analysis_cache.pop(cache_key, None)
+        if stamp is not None and cached and cached[0] == stamp:
+            _analysis_cache[cache_key] = cached  # Most recently used last
+            self.graph = cached[1]
+            return self.graph
 
-        # Skip ignored directories
-        py_files = [
-            f for f in py_files
-            if not any(p.startswith('.') or p in ('node_modules', '__pycache__', 'venv', '.venv', 'dist', 'build')
-                       for p in f.parts)
-        ]
-
-        # Analyze each file
-        for py_file in py_files:
-            file_imports = self._analyze_file(py_file)
-            self.graph.files[str(py_file)] = file_imports
+        self.graph = DependencyGraph()
 
-            # Build edges
+        # Analyze each file; reads overlap across worker threads and the
+        # per-file results are merged here on the calling thread
+        with ThreadPoolExecutor() as executor:
+            results = []
+            for py_file, (file_imports, name_counts, noqa_lines) in zip(
+                py_files, executor.map(self._analyze_file, py_files)
+            ):
+                results.append(file_imports)
+                if name_counts is not None:
+                    self._name_counts[str(py_file)] = name_counts
+                if noqa_lines:
+                    self._noqa_lines[str(py_file)] = noqa_lines
+
+        self._module_index = self._build_module_index(py_files)
+
+        # Build edges and the resolved file-to-file adjacency in one pass
+        adj: Dict[str, List[str]] = {}
+        edge_src = self.graph.edge_src
+        edge_dst = self.graph.edge_dst
+        for py_file, file_imports in zip(py_files, results):
+            file_key = str(py_file)
+            self.graph.files[file_key] = file_imports
+
+            targets: Dict[str, None] = {}
             for imp in file_imports.imports:
-                self.graph.edges.append((str(py_file), imp.module))
+                edge_src.append(file_key)
+                edge_dst.append(imp.module)
+                resolved = self._resolve_module_to_file(imp.module)
+                if resolved:
+                    targets[resolved] = None
+            if targets:
+                adj[file_key] = list(targets)
 
         # Detect circular dependencies
-        self.graph.circular = self._detect_circular()
+        self.graph.circular = self._detect_circular(adj)
 
         # Detect unused imports
         self.graph.unused = self._detect_unused()
 
+        self._name_counts.clear()
+        self._noqa_lines.clear()
+
+        if stamp is not None:
+            if len(_analysis_cache) >= _ANALYSIS_CACHE_MAX:
+                _analysis_cache.pop(next(iter(_analysis_cache)))
+            _analysis_cache[cache_key] = (stamp, self.graph)
         return self.graph
 
-    def _analyze_file(self, file_path: Path) -> FileImports:
-        """Analyze imports in a single file."""
-        result = FileImports(file_path=str(file_path))
+    def _tree_stamp(self, py_files: List[Path]) -> Optional[Tuple[int, int, int]]:
+        """Summarize file count and latest file/directory mtimes for caching.
 
+        Directory mtimes catch renames and deletions that leave every
+        remaining file untouched. Returns None if a file vanished mid-scan.
+        """
         try:
-            content = file_path.read_text(encoding='utf-8')
-        except (IOError, UnicodeDecodeError):
-            return result
+            latest_file = max((os.stat(f).st_mtime_ns for f in py_files), default=0)
+            latest_dir = max(
+                (os.stat(d).st_mtime_ns for d in {f.parent for f in py_files}),
+                default=0,
+            )
+        except OSError:
+            return None
+        return (len(py_files), latest_file, latest_dir)
 
-        lines = content.splitlines()
+    def _iter_py_files(self, root: Path):
+        """Yield Python files under root, pruning ignored directories."""
+        stack = [str(root)]
+        while stack:
+            directory = stack.pop()
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
 
-        for i, line in enumerate(lines, 1):
-            stripped = line.strip()
+            for entry in entries:
+                if entry.name.startswith('.'):
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _IGNORED_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name.endswith('.py'):
+                        yield Path(entry.path)
+                except OSError:
+                    continue
+
+    @staticmethod
+    def _analyze_file(
+        file_path: Path,
+    ) -> Tuple[FileImports, Optional[Counter], Set[int]]:
+        """Analyze imports in a single file.
+
+        Touches no analyzer state, so it is safe to run on worker threads.
+        Returns the file's imports, its identifier counts (None if it could
+        not be parsed) and the line numbers carrying a '# noqa' marker.
+        """
+        result = FileImports(file_path=str(file_path))
 
-            # Skip comments and strings
-            if stripped.startswith('#') or stripped.startswith('"') or stripped.startswith("'"):
-                continue
+        try:
+            content = file_path.read_text(encoding='utf-8')
+        except (IOError, UnicodeDecodeError):
+            return result, None, set()
 
-            # import x, import x as y
-            match = re.match(r'^import\s+(\S+)(?:\s+as\s+(\w+))?', stripped)
-            if match:
-                module = match.group(1)
-                alias = match.group(2)
-                imp = ImportInfo(
-                    module=module,
-                    names=[],
-                    alias=alias,
-                    line=i,
-                    is_relative=module.startswith('.'),
-                )
-                result.imports.append(imp)
-                self._categorize_import(result, module)
+        try:
+            tree = ast.parse(content, filename=str(file_path))
+        except (SyntaxError, ValueError):
+            return result, None, set()
+
+        import_nodes, name_counts = _scan_tree(tree)
+        noqa_lines: Set[int] = set()
+        if 'noqa' in content:
+            noqa_lines = {
+                i for i, line in enumerate(content.splitlines(), 1) if 'noqa' in line
+            }
+        import_nodes.sort(key=lambda node: (node.lineno, node.col_offset))
+
+        for node in import_nodes:
+            if isinstance(node, ast.Import):
+                # import x, import x as y
+                for alias in node.names:
+                    module = alias.name
+                    result.imports.append(ImportInfo(
+                        module=module,
+                        names=[],
+                        alias=alias.asname,
+                        line=node.lineno,
+                    ))
+                    DependencyAnalyzer._categorize_import(result, module)
                 continue
 
             # from x import y, z
-            match = re.match(r'^from\s+(\S+)\s+import\s+(.+)', stripped)
-            if match:
-                module = match.group(1)
-                imports_str = match.group(2)
-
-                # Parse imported names
-                names = []
-                for part in imports_str.split(','):
-                    part = part.strip()
-                    if ' as ' in part:
-                        name = part.split(' as ')[0].strip()
-                    else:
-                        name = part.strip('() ')
-                    if name and name != '*':
-                        names.append(name)
-
-                imp = ImportInfo(
-                    module=module,
-                    names=names,
-                    line=i,
-                    is_relative=module.startswith('.'),
-                )
-                result.imports.append(imp)
-                self._categorize_import(result, module)
-
-        return result
-
-    def _categorize_import(self, result: FileImports, module: str):
+            module = '.' * node.level + (node.module or '')
+            result.imports.append(ImportInfo(
+                module=module,
+                names=[alias.name for alias in node.names if alias.name != '*'],
+                line=node.lineno,
+                is_relative=node.level > 0,
+            ))
+            DependencyAnalyzer._categorize_import(result, module)
+
+        return result, name_counts, noqa_lines
+
+    @staticmethod
+    def _categorize_import(result: FileImports, module: str):
         """Categorize an import as stdlib, third-party, or local."""
         base_module = module.lstrip('.').split('.')[0]
 
         if module.startswith('.') or module.startswith('src'):
             result.local.append(module)
-        elif base_module in self.STDLIB_MODULES:
+        elif base_module in _STDLIB:
             result.stdlib.append(module)
         else:
             result.third_party.append(module)
 
-    def _detect_circular(self) -> List[List[str]]:
-        """Detect circular dependencies."""
+    def _detect_circular(self, adj: Dict[str, List[str]]) -> List[List[str]]:
+        """Detect circular dependencies.
+
+        Runs an iterative Tarjan SCC pass over the resolved file-to-file
+        import graph and reports every strongly connected component with more
+        than one file, plus files that import themselves.
+        """
         circular = []
 
-        # Build adjacency list
-        adj: Dict[str, Set[str]] = defaultdict(set)
-        for from_file, to_module in self.graph.edges:
-            # Try to resolve module to file
-            resolved = self._resolve_module_to_file(to_module)
-            if resolved:
-                adj[from_file].add(resolved)
-
-        # DFS to find cycles
-        visited = set()
-        rec_stack = set()
-        path = []
-
-        def dfs(node):
-            visited.add(node)
-            rec_stack.add(node)
-            path.append(node)
-
-            for neighbor in adj.get(node, []):
-                if neighbor not in visited:
-                    cycle = dfs(neighbor)
-                    if cycle:
-                        return cycle
-                elif neighbor in rec_stack:
-                    # Found cycle
-                    cycle_start = path.index(neighbor)
-                    return path[cycle_start:] + [neighbor]
-
-            path.pop()
-            rec_stack.remove(node)
-            return None
+        index: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        on_stack: Set[str] = set()
+        scc_stack: List[str] = []
+        counter = 0
+
+        for root in list(adj):
+            if root in index:
+                continue
 
-        for node in adj:
-            if node not in visited:
-                cycle = dfs(node)
-                if cycle:
-                    # Simplify to relative paths
-                    simplified = []
-                    for p in cycle:
-                        try:
-                            simplified.append(str(Path(p).relative_to(self.working_dir)))
-                        except ValueError:
-                            simplified.append(p)
-                    circular.append(simplified)
+            index[root] = lowlink[root] = counter
+            counter += 1
+            scc_stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(adj.get(root, ())))]
+
+            while work:
+                node, neighbors = work[-1]
+                descended = False
+
+                for neighbor in neighbors:
+                    if neighbor not in index:
+                        index[neighbor] = lowlink[neighbor] = counter
+                        counter += 1
+                        scc_stack.append(neighbor)
+                        on_stack.add(neighbor)
+                        work.append((neighbor, iter(adj.get(neighbor, ()))))
+                        descended = True
+                        break
+                    if neighbor in on_stack:
+                        lowlink[node] = min(lowlink[node], index[neighbor])
+
+                if descended:
+                    continue
+
+                # All neighbors visited
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = scc_stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    component.reverse()
+
+                    if len(component) > 1 or node in adj.get(node, ()):
+                        # Close the loop and simplify to relative paths
+                        cycle = component + [component[0]]
+                        circular.append([self._relative(p) for p in cycle])
 
         return circular
 
+    def _build_module_index(self, py_files: List[Path]) -> Dict[str, str]:
+        """Map dotted module names to analyzed files.
+
+        Mirrors the lookup order imports used to be resolved with: a module
+        file beats a package ``__init__.py``, and a path at the project root
+        beats the same path under ``src/``.
+        """
+        ranked: Dict[str, Tuple[int, str]] = {}
+
+        for py_file in py_files:
+            rel_path = self._rel_paths.get(str(py_file))
+            if rel_path is None:
+                continue
+            parts = rel_path[:-len('.py')].split(os.sep)
+
+            rank = 0
+            if parts[-1] == '__init__':
+                parts.pop()
+                rank = 1
+            if not parts:
+                continue
+
+            names = [('.'.join(parts), rank)]
+            if parts[0] == 'src' and len(parts) > 1:
+                names.append(('.'.join(parts[1:]), rank + 2))
+
+            for name, name_rank in names:
+                current = ranked.get(name)
+                if current is None or name_rank < current[0]:
+                    ranked[name] = (name_rank, str(py_file))
+
+        return {name: path for name, (_, path) in ranked.items()}
+
+    def _relative(self, file_path: str) -> str:
+        """Get a file path relative to working_dir for display."""
+        rel_path = self._rel_paths.get(file_path)
+        if rel_path is None:
+            try:
+                rel_path = str(Path(file_path).relative_to(self.working_dir))
+            except ValueError:
+                rel_path = file_path
+        return rel_path
+
     def _resolve_module_to_file(self, module: str) -> Optional[str]:
         """Try to resolve a module name to a file path."""
         if module.startswith('.'):
             return None  # Relative imports need more context
 
-        # Try as package
-        parts = module.replace('.', '/')
-        candidates = [
-            self.working_dir / f"{parts}.py",
-            self.working_dir / parts / "__init__.py",
-            self.working_dir / "src" / f"{parts}.py",
-            self.working_dir / "src" / parts / "__init__.py",
-        ]
-
-        for candidate in candidates:
-            if candidate.exists():
-                return str(candidate)
-
-        return None
+        return self._module_index.get(module)
 
     def _detect_unused(self) -> Dict[str, List[str]]:
         """Detect potentially unused imports."""
         unused = {}
 
         for file_path, file_imports in self.graph.files.items():
-            try:
-                content = Path(file_path).read_text(encoding='utf-8')
-            except (IOError, UnicodeDecodeError):
+            name_counts = self._name_counts.get(file_path)
+            # Modules declaring __all__ re-export their imports on purpose
+            if name_counts is None or name_counts['__all__']:
                 continue
 
             file_unused = []
+            noqa_lines = self._noqa_lines.get(file_path, ())
 
             for imp in file_imports.imports:
+                if imp.line in noqa_lines:
+                    continue
+
                 # Check if imported names are used
                 if imp.names:
                     for name in imp.names:
-                        # Simple check: is the name used in the file?
-                        pattern = rf'\b{re.escape(name)}\b'
-                        matches = len(re.findall(pattern, content))
                         # Should appear more than just in the import
-                        if matches <= 1:
+                        if name_counts[name] <= 1:
                             file_unused.append(f"{imp.module}.{name}")
                 elif imp.alias:
-                    pattern = rf'\b{re.escape(imp.alias)}\b'
-                    if len(re.findall(pattern, content)) <= 1:
+                    if name_counts[imp.alias] <= 1:
                         file_unused.append(f"{imp.module} as {imp.alias}")
                 else:
                     # Module import
                     module_name = imp.module.split('.')[-1]
-                    pattern = rf'\b{re.escape(module_name)}\b'
-                    if len(re.findall(pattern, content)) <= 1:
+                    if name_counts[module_name] <= 1:
                         file_unused.append(imp.module)
 
             if file_unused:
-                try:
-                    rel_path = str(Path(file_path).relative_to(self.working_dir))
-                except ValueError:
-                    rel_path = file_path
-                unused[rel_path] = file_unused
+                unused[self._relative(file_path)] = file_unused
 
         return unused
 
@@ -320,10 +512,7 @@ class DependencyAnalyzer:
 
         # Group by source file
         for file_path, file_imports in list(self.graph.files.items())[:20]:
-            try:
-                rel_path = str(Path(file_path).relative_to(self.working_dir))
-            except ValueError:
-                rel_path = file_path
+            rel_path = self._relative(file_path)
 
             if not file_imports.imports:
                 continue
@@ -402,6 +591,10 @@ class DependencyAnalyzer:
         return "\n".join(lines)
 
 
+# Standard library module names for import categorization
+_STDLIB = getattr(sys, 'stdlib_module_names', None) or DependencyAnalyzer.STDLIB_MODULES
+
+
 # Global analyzer
 _dependency_analyzer: Optional[DependencyAnalyzer] = None
 
@@ -8,11 +8,35 @@ Show exact changes before applying:
 """
 
 import difflib
+import io
+import re
+from itertools import islice
 from pathlib import Path
 from typing import Optional, List, Dict, Any, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
+# Try to import rapidfuzz for native word-level opcodes
+try:
+    from rapidfuzz.distance import Levenshtein
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+    Levenshtein = None
+
+
+# Unified diff hunk header: @@ -start[,count] +start[,count] @@
+_RX_HUNK = re.compile(r'^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@')
+
+# Rich markup used when formatting with color
+_GREEN, _GREEN_END = "[green]", "[/green]"
+_RED, _RED_END = "[red]", "[/red]"
+
+# File status headers as (plain, colored)
+_NEW_FILE_HEADER = ("[NEW FILE]", "[green][NEW FILE][/green]")
+_DELETED_HEADER = ("[DELETED]", "[red][DELETED][/red]")
+_MODIFIED_HEADER = ("[MODIFIED]", "[yellow][MODIFIED][/yellow]")
+
 
 class DiffAction(Enum):
     """Actions for diff hunks."""
@@ -22,19 +46,19 @@ class DiffAction(Enum):
     SKIP = "skip"
 
 
-@dataclass
+@dataclass(slots=True)
 class DiffHunk:
     """A single diff hunk (change block)."""
     start_old: int
     count_old: int
     start_new: int
     count_new: int
-    lines: List[str]
-    context_before: List[str]
-    context_after: List[str]
+    lines: List[str] = field(default_factory=list)
+    context_before: List[str] = field(default_factory=list)
+    context_after: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class FileDiff:
     """Diff for a single file."""
     file_path: str
@@ -51,7 +75,8 @@ class DiffPreview:
     def __init__(self, context_lines: int = 3):
         """Initialize diff preview."""
         self.context_lines = context_lines
-        self.pending_changes: List[FileDiff] = []
+        # Pending changes keyed by file path, in the order they were added
+        self._pending: Dict[str, FileDiff] = {}
 
     def create_diff(
         self,
@@ -70,20 +95,23 @@ class DiffPreview:
         Returns:
             FileDiff object with hunks
         """
-        old_lines = old_content.splitlines(keepends=True)
-        new_lines = new_content.splitlines(keepends=True)
-
-        # Generate unified diff
-        diff = list(difflib.unified_diff(
-            old_lines,
-            new_lines,
-            fromfile=f"a/{file_path}",
-            tofile=f"b/{file_path}",
-            n=self.context_lines,
-        ))
-
-        # Parse into hunks
-        hunks = self._parse_hunks(diff)
+        if old_content == new_content:
+            hunks = []
+        elif not old_content or not new_content:
+            # Whole file added or removed - no need to run the matcher
+            hunks = [self._whole_file_hunk(old_content, new_content)]
+        else:
+            # Generate unified diff
+            diff = list(difflib.unified_diff(
+                old_content.splitlines(keepends=True),
+                new_content.splitlines(keepends=True),
+                fromfile=f"a/{file_path}",
+                tofile=f"b/{file_path}",
+                n=self.context_lines,
+            ))
+
+            # Parse into hunks
+            hunks = self._parse_hunks(diff)
 
         return FileDiff(
             file_path=file_path,
@@ -94,42 +122,62 @@ class DiffPreview:
             is_deleted=len(new_content) == 0,
         )
 
+    def _whole_file_hunk(self, old_content: str, new_content: str) -> DiffHunk:
+        """Build the single hunk for a file that is entirely added or removed."""
+        if old_content:
+            old_lines = old_content.splitlines(keepends=True)
+            return DiffHunk(
+                start_old=1,
+                count_old=len(old_lines),
+                start_new=0,
+                count_new=0,
+                lines=["-" + line for line in old_lines],
+                context_before=[],
+                context_after=[],
+            )
+
+        new_lines = new_content.splitlines(keepends=True)
+        return DiffHunk(
+            start_old=0,
+            count_old=0,
+            start_new=1,
+            count_new=len(new_lines),
+            lines=["+" + line for line in new_lines],
+            context_before=[],
+            context_after=[],
+        )
+
     def _parse_hunks(self, diff_lines: List[str]) -> List[DiffHunk]:
         """Parse diff output into hunks."""
         hunks = []
-        current_hunk = None
-        current_lines = []
+        append = None
 
-        for line in diff_lines:
-            if line.startswith("@@"):
-                # Save previous hunk
-                if current_hunk:
-                    current_hunk.lines = current_lines
-                    hunks.append(current_hunk)
+        # File headers only appear before the first hunk
+        start = 0
+        while start < len(diff_lines) and start < 2 and diff_lines[start].startswith(("---", "+++")):
+            start += 1
 
-                # Parse hunk header: @@ -start,count +start,count @@
-                parts = line.split()
-                old_range = parts[1][1:].split(",")
-                new_range = parts[2][1:].split(",")
+        for line in islice(diff_lines, start, None):
+            if line.startswith("@@"):
+                match = _RX_HUNK.match(line)
+                if not match:
+                    continue
 
+                start_old, count_old, start_new, count_new = match.groups()
                 current_hunk = DiffHunk(
-                    start_old=int(old_range[0]),
-                    count_old=int(old_range[1]) if len(old_range) > 1 else 1,
-                    start_new=int(new_range[0]),
-                    count_new=int(new_range[1]) if len(new_range) > 1 else 1,
+                    start_old=int(start_old),
+                    count_old=int(count_old) if count_old is not None else 1,
+                    start_new=int(start_new),
+                    count_new=int(count_new) if count_new is not None else 1,
                     lines=[],
                     context_before=[],
                     context_after=[],
                 )
-                current_lines = []
+                hunks.append(current_hunk)
+                append = current_hunk.lines.append
 
-            elif current_hunk and not line.startswith(("---", "+++")):
-                current_lines.append(line)
-
-        # Save last hunk
-        if current_hunk:
-            current_hunk.lines = current_lines
-            hunks.append(current_hunk)
+            elif append:
+                append(line)
 
         return hunks
 
@@ -144,50 +192,51 @@ class DiffPreview:
         Returns:
             Formatted diff string
         """
-        lines = []
-
+        buf = io.StringIO()
+        for line in self._iter_diff_lines(file_diff, color):
+            buf.write(line)
+            buf.write("\n")
+        return buf.getvalue()
+
+    def _iter_diff_lines(self, file_diff: FileDiff, color: bool):
+        """Yield the display lines of a diff, without line terminators."""
         # Header
+        style = 1 if color else 0
         if file_diff.is_new_file:
-            lines.append(f"{'[NEW FILE]' if not color else '[green][NEW FILE][/green]'} {file_diff.file_path}")
+            header = _NEW_FILE_HEADER[style]
         elif file_diff.is_deleted:
-            lines.append(f"{'[DELETED]' if not color else '[red][DELETED][/red]'} {file_diff.file_path}")
+            header = _DELETED_HEADER[style]
         else:
-            lines.append(f"{'[MODIFIED]' if not color else '[yellow][MODIFIED][/yellow]'} {file_diff.file_path}")
-
-        lines.append("")
+            header = _MODIFIED_HEADER[style]
+        yield f"{header} {file_diff.file_path}"
 
         # Hunks
+        total = len(file_diff.hunks)
         for i, hunk in enumerate(file_diff.hunks, 1):
-            lines.append(f"--- Hunk {i}/{len(file_diff.hunks)} ---")
-            lines.append(f"@@ -{hunk.start_old},{hunk.count_old} +{hunk.start_new},{hunk.count_new} @@")
+            yield ""
+            yield f"--- Hunk {i}/{total} ---"
+            yield f"@@ -{hunk.start_old},{hunk.count_old} +{hunk.start_new},{hunk.count_new} @@"
 
             for line in hunk.lines:
                 if line.startswith("+"):
-                    if color:
-                        lines.append(f"[green]{line.rstrip()}[/green]")
-                    else:
-                        lines.append(line.rstrip())
+                    yield _GREEN + line.rstrip() + _GREEN_END if color else line.rstrip()
                 elif line.startswith("-"):
-                    if color:
-                        lines.append(f"[red]{line.rstrip()}[/red]")
-                    else:
-                        lines.append(line.rstrip())
+                    yield _RED + line.rstrip() + _RED_END if color else line.rstrip()
                 else:
-                    lines.append(f"  {line.rstrip()}" if line.strip() else "")
-
-            lines.append("")
-
-        return "\n".join(lines)
+                    yield f"  {line.rstrip()}" if line.strip() else ""
 
     def format_inline_diff(self, old_content: str, new_content: str) -> str:
         """Format an inline word-by-word diff."""
         old_words = old_content.split()
         new_words = new_content.split()
 
-        matcher = difflib.SequenceMatcher(None, old_words, new_words)
+        if RAPIDFUZZ_AVAILABLE:
+            opcodes = Levenshtein.opcodes(old_words, new_words)
+        else:
+            opcodes = difflib.SequenceMatcher(None, old_words, new_words).get_opcodes()
         result = []
 
-        for op, i1, i2, j1, j2 in matcher.get_opcodes():
+        for op, i1, i2, j1, j2 in opcodes:
             if op == "equal":
                 result.extend(old_words[i1:i2])
             elif op == "delete":
@@ -202,24 +251,25 @@ class DiffPreview:
 
     def add_pending_change(self, file_diff: FileDiff):
         """Add a change to pending list."""
-        # Remove existing diff for same file
-        self.pending_changes = [d for d in self.pending_changes if d.file_path != file_diff.file_path]
-        self.pending_changes.append(file_diff)
+        # Replace any existing diff for the same file, moving it to the end
+        self._pending.pop(file_diff.file_path, None)
+        self._pending[file_diff.file_path] = file_diff
 
     def get_pending_changes(self) -> List[FileDiff]:
         """Get all pending changes."""
-        return self.pending_changes
+        return list(self._pending.values())
 
     def clear_pending(self):
         """Clear all pending changes."""
-        self.pending_changes = []
+        self._pending.clear()
 
-    def apply_change(self, file_diff: FileDiff) -> Dict[str, Any]:
+    def apply_change(self, file_diff: FileDiff, create_parents: bool = True) -> Dict[str, Any]:
         """
         Apply a file change.
 
         Args:
             file_diff: The diff to apply
+            create_parents: Create missing parent directories first
 
         Returns:
             Result dict
@@ -233,7 +283,8 @@ class DiffPreview:
                 return {"success": True, "action": "deleted", "path": str(file_path)}
 
             # Create parent dirs if needed
-            file_path.parent.mkdir(parents=True, exist_ok=True)
+            if create_parents:
+                file_path.parent.mkdir(parents=True, exist_ok=True)
 
             # Write new content
             file_path.write_text(file_diff.new_content, encoding='utf-8')
@@ -245,9 +296,19 @@ class DiffPreview:
 
     def apply_all_pending(self) -> List[Dict[str, Any]]:
         """Apply all pending changes."""
+        # Create each parent directory once rather than once per file
+        ready_parents = set()
+        for parent in {Path(d.file_path).parent for d in self._pending.values() if not d.is_deleted}:
+            try:
+                parent.mkdir(parents=True, exist_ok=True)
+                ready_parents.add(parent)
+            except OSError:
+                pass  # apply_change retries and reports the error
+
         results = []
-        for diff in self.pending_changes:
-            results.append(self.apply_change(diff))
+        for diff in self._pending.values():
+            created = diff.is_deleted or Path(diff.file_path).parent in ready_parents
+            results.append(self.apply_change(diff, create_parents=not created))
         self.clear_pending()
         return results
 
@@ -7,14 +7,66 @@ Generate documentation automatically:
 - Changelog generation
 """
 
+import ast
+import copy
+import hashlib
+import heapq
+import json
+import os
 import re
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional, List, Dict, Any
-from dataclasses import dataclass, field
+from typing import Optional, List, Dict, Any, Set, Tuple
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 
 
-@dataclass
+# Patterns for parsing raw code snippets passed to generate_docstring()
+_DEF_RE = re.compile(r'(?:async\s+)?def\s+(\w+)\s*\(([^)]*)\)(?:\s*->\s*([^:]+))?:')
+_CLASS_RE = re.compile(r'class\s+(\w+)(?:\(([^)]*)\))?:')
+_INIT_RE = re.compile(r'def\s+__init__\s*\(([^)]*)\)')
+# Possessive type group: it can never give back characters to the default
+_PARAM_RE = re.compile(r'(\w+)\s*(?::\s*([^=]++))?(?:=\s*(.+))?', re.DOTALL)
+_OPENERS = {'(': ')', '[': ']', '{': '}'}
+
+_NUMPY_PARAMS_HDR = "Parameters\n----------"
+_NUMPY_RETURNS_HDR = "Returns\n-------"
+
+# Bump when ModuleDoc's layout or extraction changes to orphan old cache entries
+_DOC_CACHE_VERSION = b"2"
+# Most module docs kept in a disk cache directory; the oldest go first
+_DOC_CACHE_MAX_FILES = 1024
+
+def _split_top_level(text: str) -> List[str]:
+    """Split on commas that are not nested in brackets or string literals."""
+    parts = []
+    closers = []
+    quote = ''
+    start = 0
+    i = 0
+    n = len(text)
+    while i < n:
+        ch = text[i]
+        if quote:
+            if ch == '\\':
+                i += 1
+            elif ch == quote:
+                quote = ''
+        elif ch in '"\'':
+            quote = ch
+        elif ch in _OPENERS:
+            closers.append(_OPENERS[ch])
+        elif closers and ch == closers[-1]:
+            closers.pop()
+        elif ch == ',' and not closers:
+            parts.append(text[start:i])
+            start = i + 1
+        i += 1
+    parts.append(text[start:])
+    return parts
+
+
+@dataclass(slots=True)
 class FunctionDoc:
     """Documentation for a function."""
     name: str
@@ -26,7 +78,7 @@ class FunctionDoc:
     examples: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ClassDoc:
     """Documentation for a class."""
     name: str
@@ -36,7 +88,7 @@ class ClassDoc:
     attributes: List[Dict[str, str]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ModuleDoc:
     """Documentation for a module."""
     path: str
@@ -48,12 +100,36 @@ class ModuleDoc:
     constants: List[Dict[str, str]] = field(default_factory=list)
 
 
+def _module_doc_from_dict(data: Dict[str, Any]) -> ModuleDoc:
+    """Rebuild a ModuleDoc from its asdict() form."""
+    data = dict(data)
+    data['functions'] = [FunctionDoc(**f) for f in data['functions']]
+    data['classes'] = [
+        ClassDoc(**{**c, 'methods': [FunctionDoc(**m) for m in c['methods']]})
+        for c in data['classes']
+    ]
+    return ModuleDoc(**data)
+
+
 class DocGenerator:
     """Generate documentation for code."""
 
-    def __init__(self, working_dir: Optional[Path] = None):
-        """Initialize doc generator."""
+    def __init__(
+        self,
+        working_dir: Optional[Path] = None,
+        cache: bool = True,
+        cache_dir: Optional[Path] = None,
+    ):
+        """Initialize doc generator.
+
+        Module docs are cached in memory by (path, mtime, size) unless
+        ``cache`` is False. Passing ``cache_dir`` also caches them there as
+        JSON by source hash, keeping at most the newest 1024.
+        """
         self.working_dir = working_dir or Path.cwd()
+        self.cache_dir: Optional[Path] = cache_dir if cache else None
+        self._mem_cache: Optional[Dict[Tuple[str, int, int], ModuleDoc]] = {} if cache else None
+        self._stores = 0
 
     def generate_module_doc(self, file_path: str) -> ModuleDoc:
         """Generate documentation for a Python module."""
@@ -61,164 +137,174 @@ class DocGenerator:
         if not path.is_absolute():
             path = self.working_dir / file_path
 
-        try:
-            content = path.read_text(encoding='utf-8')
-        except (IOError, UnicodeDecodeError):
-            return ModuleDoc(path=str(path), name=path.stem)
-
         doc = ModuleDoc(
             path=str(path),
             name=path.stem,
         )
 
-        # Extract module docstring
-        doc.docstring = self._extract_module_docstring(content)
-
-        # Extract imports
-        doc.imports = self._extract_imports(content)
-
-        # Extract classes
-        doc.classes = self._extract_classes(content)
-
-        # Extract top-level functions
-        doc.functions = self._extract_functions(content, top_level=True)
+        cache_key = None
+        stat_key = None
+        try:
+            if self._mem_cache is not None:
+                st = path.stat()
+                stat_key = (str(path), st.st_mtime_ns, st.st_size)
+                cached = self._mem_cache.get(stat_key)
+                if cached is not None:
+                    return copy.deepcopy(cached)
+            raw = path.read_bytes()
+            if self.cache_dir is not None:
+                cache_key = self._cache_key(path, raw)
+                cached = self._load_cached(cache_key)
+                if cached is not None:
+                    if stat_key is not None:
+                        self._remember(stat_key, cached)
+                    return cached
+            content = raw.decode('utf-8')
+            tree = ast.parse(content, filename=str(path))
+        except (IOError, UnicodeDecodeError, SyntaxError, ValueError):
+            return doc
 
+        # Extract module docstring
+        doc.docstring = ast.get_docstring(tree) or ""
+
+        # Walk the top level once for imports, classes, functions and constants
+        for node in tree.body:
+            if isinstance(node, (ast.Import, ast.ImportFrom)):
+                doc.imports.append(ast.unparse(node))
+            elif isinstance(node, ast.ClassDef):
+                doc.classes.append(self._class_doc(node))
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                doc.functions.append(self._function_doc(node))
+            elif isinstance(node, ast.Assign):
+                for target in node.targets:
+                    if isinstance(target, ast.Name) and target.id.isupper():
+                        doc.constants.append({
+                            'name': target.id,
+                            'value': ast.unparse(node.value),
+                        })
+
+        if cache_key is not None:
+            self._store_cached(cache_key, doc)
+        if stat_key is not None:
+            self._remember(stat_key, doc)
         return doc
 
-    def _extract_module_docstring(self, content: str) -> str:
-        """Extract module-level docstring."""
-        match = re.match(r'^[\s]*(?:\"\"\"|\'\'\')([\s\S]*?)(?:\"\"\"|\'\'\')', content)
-        if match:
-            return match.group(1).strip()
-        return ""
-
-    def _extract_imports(self, content: str) -> List[str]:
-        """Extract import statements."""
-        imports = []
-        for match in re.finditer(r'^(?:from\s+\S+\s+)?import\s+.+$', content, re.MULTILINE):
-            imports.append(match.group(0).strip())
-        return imports
-
-    def _extract_classes(self, content: str) -> List[ClassDoc]:
-        """Extract class definitions."""
-        classes = []
-
-        pattern = r'^class\s+(\w+)(?:\(([^)]*)\))?:'
-        for match in re.finditer(pattern, content, re.MULTILINE):
-            class_name = match.group(1)
-            bases = [b.strip() for b in (match.group(2) or '').split(',') if b.strip()]
-
-            # Find class body
-            start = match.end()
-            class_body = self._extract_indented_block(content[start:])
-
-            class_doc = ClassDoc(
-                name=class_name,
-                bases=bases,
-                docstring=self._extract_first_docstring(class_body),
-                methods=self._extract_methods(class_body),
-            )
-            classes.append(class_doc)
-
-        return classes
-
-    def _extract_methods(self, class_body: str) -> List[FunctionDoc]:
-        """Extract methods from class body."""
-        methods = []
-        pattern = r'def\s+(\w+)\s*\(([^)]*)\)(?:\s*->\s*([^:]+))?:'
-
-        for match in re.finditer(pattern, class_body):
-            name = match.group(1)
-            params = match.group(2)
-            return_type = match.group(3).strip() if match.group(3) else ""
-
-            # Find method body
-            start = match.end()
-            method_body = self._extract_indented_block(class_body[start:])
-            docstring = self._extract_first_docstring(method_body)
-
-            func_doc = FunctionDoc(
-                name=name,
-                signature=f"{name}({params})",
-                docstring=docstring,
-                params=self._parse_params(params),
-                returns=return_type,
-            )
-            methods.append(func_doc)
-
-        return methods
-
-    def _extract_functions(self, content: str, top_level: bool = False) -> List[FunctionDoc]:
-        """Extract function definitions."""
-        functions = []
-        pattern = r'^def\s+(\w+)\s*\(([^)]*)\)(?:\s*->\s*([^:]+))?:' if top_level else r'def\s+(\w+)\s*\(([^)]*)\)(?:\s*->\s*([^:]+))?:'
-        flags = re.MULTILINE if top_level else 0
-
-        for match in re.finditer(pattern, content, flags):
-            name = match.group(1)
-            params = match.group(2)
-            return_type = match.group(3).strip() if match.group(3) else ""
-
-            # Find function body
-            start = match.end()
-            func_body = self._extract_indented_block(content[start:])
-            docstring = self._extract_first_docstring(func_body)
-
-            func_doc = FunctionDoc(
-                name=name,
-                signature=f"{name}({params})",
-                docstring=docstring,
-                params=self._parse_params(params),
-                returns=return_type,
-            )
-            functions.append(func_doc)
+    def _remember(self, key: Tuple[str, int, int], doc: ModuleDoc):
+        """Keep a private copy of a module doc, evicting the oldest past 2048 entries.
 
-        return functions
+        Hits are copied too, so callers may freely modify what they get back.
+        """
+        if len(self._mem_cache) >= 2048:
+            del self._mem_cache[next(iter(self._mem_cache))]
+        self._mem_cache[key] = copy.deepcopy(doc)
+
+    def _cache_key(self, path: Path, raw: bytes) -> str:
+        """Hash a module's path and source into a cache key."""
+        h = hashlib.blake2b(digest_size=16, usedforsecurity=False)
+        h.update(_DOC_CACHE_VERSION)
+        h.update(str(path).encode('utf-8', 'surrogateescape'))
+        h.update(b"\0")
+        h.update(raw)
+        return h.hexdigest()
+
+    def _load_cached(self, key: str) -> Optional[ModuleDoc]:
+        """Load a cached module doc, or None on a miss or unreadable entry."""
+        try:
+            with open(self.cache_dir / f"{key}.json", "rb") as f:
+                return _module_doc_from_dict(json.load(f))
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            return None
+
+    def _store_cached(self, key: str, doc: ModuleDoc):
+        """Write a module doc to the cache; failures only cost a re-parse."""
+        target = self.cache_dir / f"{key}.json"
+        tmp = target.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(asdict(doc), f)
+            os.replace(tmp, target)
+        except OSError:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+
+        # Prune on the first write and every 128 after it
+        if self._stores % 128 == 0:
+            self._prune_cache()
+        self._stores += 1
+
+    def _prune_cache(self):
+        """Delete the oldest cached docs beyond _DOC_CACHE_MAX_FILES."""
+        try:
+            with os.scandir(self.cache_dir) as it:
+                entries = [
+                    (entry.stat().st_mtime_ns, entry.path)
+                    for entry in it if entry.name.endswith(".json")
+                ]
+        except OSError:
+            return
+        excess = len(entries) - _DOC_CACHE_MAX_FILES
+        if excess <= 0:
+            return
+        for _, path in heapq.nsmallest(excess, entries):
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+    def _class_doc(self, node: ast.ClassDef) -> ClassDoc:
+        """Build documentation for a class definition."""
+        return ClassDoc(
+            name=node.name,
+            bases=[ast.unparse(base) for base in node.bases],
+            docstring=ast.get_docstring(node) or "",
+            methods=[
+                self._function_doc(item) for item in node.body
+                if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef))
+            ],
+        )
 
-    def _extract_indented_block(self, content: str) -> str:
-        """Extract indented code block."""
-        lines = content.splitlines()
-        if not lines:
-            return ""
+    def _function_doc(self, node: ast.FunctionDef) -> FunctionDoc:
+        """Build documentation for a function or method definition."""
+        return FunctionDoc(
+            name=node.name,
+            signature=f"{node.name}({ast.unparse(node.args)})",
+            docstring=ast.get_docstring(node) or "",
+            params=self._params_from_args(node.args),
+            returns=ast.unparse(node.returns) if node.returns else "",
+        )
 
-        # Find base indentation
-        result = []
-        base_indent = None
+    def _params_from_args(self, args: ast.arguments) -> List[Dict[str, str]]:
+        """Describe named parameters of a parsed signature."""
+        positional = args.posonlyargs + args.args
+        # Defaults line up with the last positional parameters
+        defaults = [None] * (len(positional) - len(args.defaults)) + list(args.defaults)
 
-        for line in lines:
-            if not line.strip():
-                result.append(line)
+        params = []
+        pairs = list(zip(positional, defaults)) + list(zip(args.kwonlyargs, args.kw_defaults))
+        for arg, default in pairs:
+            if arg.arg in ('self', 'cls'):
                 continue
+            params.append({
+                'name': arg.arg,
+                'type': ast.unparse(arg.annotation) if arg.annotation else '',
+                'default': ast.unparse(default) if default is not None else '',
+            })
 
-            indent = len(line) - len(line.lstrip())
-
-            if base_indent is None:
-                base_indent = indent
-                result.append(line)
-            elif indent >= base_indent:
-                result.append(line)
-            else:
-                break
-
-        return "\n".join(result)
-
-    def _extract_first_docstring(self, content: str) -> str:
-        """Extract first docstring from content."""
-        match = re.search(r'(?:\"\"\"|\'\'\')([\s\S]*?)(?:\"\"\"|\'\'\')', content[:500])
-        if match:
-            return match.group(1).strip()
-        return ""
+        return params
 
     def _parse_params(self, params_str: str) -> List[Dict[str, str]]:
         """Parse function parameters."""
         params = []
-        for param in params_str.split(','):
+        for param in _split_top_level(params_str):
             param = param.strip()
             if not param or param == 'self' or param == 'cls':
                 continue
 
             # Parse name: type = default
-            match = re.match(r'(\w+)(?::\s*([^=]+))?(?:=\s*(.+))?', param)
+            match = _PARAM_RE.match(param)
             if match:
                 params.append({
                     'name': match.group(1),
@@ -255,7 +341,7 @@ class DocGenerator:
     def _generate_function_docstring(self, code: str, style: str) -> str:
         """Generate docstring for a function."""
         # Extract function info
-        match = re.search(r'(?:async\s+)?def\s+(\w+)\s*\(([^)]*)\)(?:\s*->\s*([^:]+))?:', code)
+        match = _DEF_RE.search(code)
         if not match:
             return '"""TODO: Add docstring."""'
 
@@ -265,17 +351,13 @@ class DocGenerator:
 
         params = self._parse_params(params_str)
 
-        # Generate based on style
-        if style == "google":
-            return self._format_google_docstring(name, params, return_type)
-        elif style == "numpy":
-            return self._format_numpy_docstring(name, params, return_type)
-        else:
-            return self._format_sphinx_docstring(name, params, return_type)
+        # Generate based on style; unknown styles fall back to Sphinx
+        formatter = self._STYLE_FORMATTERS.get(style, DocGenerator._format_sphinx_docstring)
+        return formatter(self, name, params, return_type)
 
     def _generate_class_docstring(self, code: str, style: str) -> str:
         """Generate docstring for a class."""
-        match = re.search(r'class\s+(\w+)(?:\(([^)]*)\))?:', code)
+        match = _CLASS_RE.search(code)
         if not match:
             return '"""TODO: Add docstring."""'
 
@@ -283,26 +365,25 @@ class DocGenerator:
         bases = [b.strip() for b in (match.group(2) or '').split(',') if b.strip()]
 
         # Find __init__ params
-        init_match = re.search(r'def\s+__init__\s*\(([^)]*)\)', code)
+        init_match = _INIT_RE.search(code)
         init_params = []
         if init_match:
             init_params = self._parse_params(init_match.group(1))
 
-        lines = [f'"""{name} class.', '']
+        parts = [f'"""{name} class.\n']
 
         if bases:
-            lines.append(f"Inherits from: {', '.join(bases)}")
-            lines.append('')
+            parts.append(f"Inherits from: {', '.join(bases)}\n")
 
         if init_params and style == "google":
-            lines.append("Attributes:")
-            for p in init_params:
-                ptype = f" ({p['type']})" if p['type'] else ""
-                lines.append(f"    {p['name']}{ptype}: Description.")
-            lines.append('')
+            attrs = "\n".join(
+                f"    {p['name']}{' (' + p['type'] + ')' if p['type'] else ''}: Description."
+                for p in init_params
+            )
+            parts.append(f"Attributes:\n{attrs}\n")
 
-        lines.append('"""')
-        return "\n".join(lines)
+        parts.append('"""')
+        return "\n".join(parts)
 
     def _format_google_docstring(
         self,
@@ -311,23 +392,21 @@ class DocGenerator:
         return_type: str,
     ) -> str:
         """Format Google-style docstring."""
-        lines = [f'"""Brief description of {name}.', '']
+        parts = [f'"""Brief description of {name}.\n']
 
         if params:
-            lines.append("Args:")
-            for p in params:
-                ptype = f" ({p['type']})" if p['type'] else ""
-                default = f" Defaults to {p['default']}." if p['default'] else ""
-                lines.append(f"    {p['name']}{ptype}: Description.{default}")
-            lines.append('')
+            args = "\n".join(
+                f"    {p['name']}{' (' + p['type'] + ')' if p['type'] else ''}: Description."
+                f"{' Defaults to ' + p['default'] + '.' if p['default'] else ''}"
+                for p in params
+            )
+            parts.append(f"Args:\n{args}\n")
 
         if return_type and return_type != "None":
-            lines.append("Returns:")
-            lines.append(f"    {return_type}: Description.")
-            lines.append('')
+            parts.append(f"Returns:\n    {return_type}: Description.\n")
 
-        lines.append('"""')
-        return "\n".join(lines)
+        parts.append('"""')
+        return "\n".join(parts)
 
     def _format_numpy_docstring(
         self,
@@ -336,26 +415,20 @@ class DocGenerator:
         return_type: str,
     ) -> str:
         """Format NumPy-style docstring."""
-        lines = [f'"""Brief description of {name}.', '']
+        parts = [f'"""Brief description of {name}.\n']
 
         if params:
-            lines.append("Parameters")
-            lines.append("-" * 10)
-            for p in params:
-                ptype = f" : {p['type']}" if p['type'] else ""
-                lines.append(f"{p['name']}{ptype}")
-                lines.append("    Description.")
-            lines.append('')
+            entries = "\n".join(
+                f"{p['name']}{' : ' + p['type'] if p['type'] else ''}\n    Description."
+                for p in params
+            )
+            parts.append(f"{_NUMPY_PARAMS_HDR}\n{entries}\n")
 
         if return_type and return_type != "None":
-            lines.append("Returns")
-            lines.append("-" * 7)
-            lines.append(f"{return_type}")
-            lines.append("    Description.")
-            lines.append('')
+            parts.append(f"{_NUMPY_RETURNS_HDR}\n{return_type}\n    Description.\n")
 
-        lines.append('"""')
-        return "\n".join(lines)
+        parts.append('"""')
+        return "\n".join(parts)
 
     def _format_sphinx_docstring(
         self,
@@ -364,45 +437,58 @@ class DocGenerator:
         return_type: str,
     ) -> str:
         """Format Sphinx-style docstring."""
-        lines = [f'"""Brief description of {name}.', '']
+        parts = [f'"""Brief description of {name}.\n']
 
-        for p in params:
-            ptype = f" {p['type']}" if p['type'] else ""
-            lines.append(f":param{ptype} {p['name']}: Description.")
+        parts.extend(
+            f":param{' ' + p['type'] if p['type'] else ''} {p['name']}: Description."
+            for p in params
+        )
 
         if return_type and return_type != "None":
-            lines.append(f":returns: Description.")
-            lines.append(f":rtype: {return_type}")
+            parts.append(f":returns: Description.\n:rtype: {return_type}")
 
-        lines.append('"""')
-        return "\n".join(lines)
+        parts.append('"""')
+        return "\n".join(parts)
+
+    _STYLE_FORMATTERS = {
+        "google": _format_google_docstring,
+        "numpy": _format_numpy_docstring,
+        "sphinx": _format_sphinx_docstring,
+    }
 
     def generate_readme(self) -> str:
         """Generate README.md content for the project."""
         lines = []
 
+        # One directory read answers every marker-file check below
+        try:
+            with os.scandir(self.working_dir) as it:
+                names = {entry.name for entry in it}
+        except OSError:
+            names = set()  # Missing or unreadable working directory
+
         # Project name
         project_name = self.working_dir.name.replace("-", " ").replace("_", " ").title()
         lines.append(f"# {project_name}")
         lines.append("")
 
         # Try to detect project type
-        project_type = self._detect_project_type()
+        project_type = self._detect_project_type(names)
         lines.append(f"{project_name} is a {project_type} project.")
         lines.append("")
 
         # Installation
         lines.append("## Installation")
         lines.append("")
-        if (self.working_dir / "requirements.txt").exists():
+        if "requirements.txt" in names:
             lines.append("```bash")
             lines.append("pip install -r requirements.txt")
             lines.append("```")
-        elif (self.working_dir / "package.json").exists():
+        elif "package.json" in names:
             lines.append("```bash")
             lines.append("npm install")
             lines.append("```")
-        elif (self.working_dir / "Cargo.toml").exists():
+        elif "Cargo.toml" in names:
             lines.append("```bash")
             lines.append("cargo build")
             lines.append("```")
@@ -427,22 +513,22 @@ class DocGenerator:
         # License
         lines.append("## License")
         lines.append("")
-        if (self.working_dir / "LICENSE").exists():
+        if "LICENSE" in names:
             lines.append("See LICENSE file for details.")
         else:
             lines.append("TODO: Add license information.")
 
         return "\n".join(lines)
 
-    def _detect_project_type(self) -> str:
-        """Detect project type."""
-        if (self.working_dir / "pyproject.toml").exists():
+    def _detect_project_type(self, names: Set[str]) -> str:
+        """Detect project type from the top-level file names."""
+        if "pyproject.toml" in names:
             return "Python"
-        if (self.working_dir / "package.json").exists():
+        if "package.json" in names:
             return "JavaScript/TypeScript"
-        if (self.working_dir / "Cargo.toml").exists():
+        if "Cargo.toml" in names:
             return "Rust"
-        if (self.working_dir / "go.mod").exists():
+        if "go.mod" in names:
             return "Go"
         return "software"
 
@@ -451,25 +537,43 @@ class DocGenerator:
         lines = []
         lines.append(self.working_dir.name + "/")
 
-        def add_items(path: Path, prefix: str = ""):
-            items = sorted(path.iterdir(), key=lambda x: (not x.is_dir(), x.name))
-            dirs = [i for i in items if i.is_dir() and not i.name.startswith('.')]
-            files = [i for i in items if i.is_file() and not i.name.startswith('.')]
-
-            # Filter out common ignored dirs
-            ignore = {'node_modules', '__pycache__', '.git', 'venv', '.venv', 'dist', 'build'}
-            dirs = [d for d in dirs if d.name not in ignore]
-
-            for i, item in enumerate(dirs[:5] + files[:10]):
-                is_last = i == len(dirs[:5] + files[:10]) - 1
+        # Filter out common ignored dirs
+        ignore = {'node_modules', '__pycache__', '.git', 'venv', '.venv', 'dist', 'build'}
+
+        def add_items(path: str, prefix: str = "", depth: int = 0):
+            if len(lines) >= 30:
+                return
+
+            dirs = []
+            files = []
+            try:
+                with os.scandir(path) as it:
+                    for entry in it:
+                        if entry.name.startswith('.'):
+                            continue
+                        if entry.is_dir():
+                            if entry.name not in ignore:
+                                dirs.append(entry)
+                        elif entry.is_file():
+                            files.append(entry)
+            except OSError:
+                return  # Missing or unreadable directory
+
+            by_name = attrgetter('name')
+            items = heapq.nsmallest(5, dirs, key=by_name) + heapq.nsmallest(10, files, key=by_name)
+
+            for i, item in enumerate(items):
+                if len(lines) >= 30:
+                    return
+                is_last = i == len(items) - 1
                 connector = "└── " if is_last else "├── "
                 lines.append(f"{prefix}{connector}{item.name}")
 
-                if item.is_dir() and len(prefix) < 12:
+                if depth < 3 and item.is_dir():
                     new_prefix = prefix + ("    " if is_last else "│   ")
-                    add_items(item, new_prefix)
+                    add_items(item.path, new_prefix, depth + 1)
 
-        add_items(self.working_dir)
+        add_items(str(self.working_dir))
         return lines[:30]  # Limit
 
 
@@ -7,15 +7,33 @@ Docker utilities:
 - Docker Compose support
 """
 
+import asyncio
+import shlex
+import shutil
 import subprocess
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable, Tuple, Union
 from dataclasses import dataclass, field
 from datetime import datetime
 
+# Parse Docker's JSON output with orjson when it is installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
-@dataclass
+
+def _command_args(command: Union[str, List[str]]) -> List[str]:
+    """Turn a container command into argv, honouring shell quoting in strings."""
+    if isinstance(command, str):
+        return shlex.split(command)
+    return command
+
+
+@dataclass(slots=True)
 class Container:
     """A Docker container."""
     id: str
@@ -37,7 +55,7 @@ class Container:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Image:
     """A Docker image."""
     id: str
@@ -57,7 +75,7 @@ class Image:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class DockerResult:
     """Result of a Docker operation."""
     success: bool
@@ -73,21 +91,44 @@ class DockerTools:
         """Initialize Docker tools."""
         self.working_dir = working_dir or Path.cwd()
         self._docker_available: Optional[bool] = None
+        # Short-lived cache of read-only queries: key -> (timestamp, value)
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+        self._cache_ttl = 5.0
+
+    def _cached(self, key: str, loader: Callable[[], Any]) -> Any:
+        """Return a cached query result, reloading it once the TTL has expired.
+
+        Loaders return None when the Docker command fails; failures are
+        passed through uncached so the next call retries.
+        """
+        entry = self._cache.get(key)
+        now = time.monotonic()
+        if entry is not None and now - entry[0] < self._cache_ttl:
+            return entry[1]
+
+        value = loader()
+        if value is not None:
+            self._cache[key] = (now, value)
+        return value
+
+    def invalidate_cache(self):
+        """Drop cached info, container and image listings."""
+        self._cache.clear()
 
     def is_available(self) -> bool:
-        """Check if Docker is available."""
+        """Check if the Docker CLI is installed (on PATH).
+
+        This does not spawn a process; use is_daemon_running() to check
+        that the daemon is reachable.
+        """
         if self._docker_available is None:
-            try:
-                result = subprocess.run(
-                    ["docker", "--version"],
-                    capture_output=True,
-                    timeout=5,
-                )
-                self._docker_available = result.returncode == 0
-            except (subprocess.SubprocessError, FileNotFoundError):
-                self._docker_available = False
+            self._docker_available = shutil.which("docker") is not None
         return self._docker_available
 
+    def is_daemon_running(self) -> bool:
+        """Check if the Docker daemon answers, reusing the cached info query."""
+        return self.is_available() and bool(self.get_info())
+
     def _run_docker(
         self,
         args: List[str],
@@ -120,6 +161,55 @@ class DockerTools:
 
         return result
 
+    async def _run_docker_async(
+        self,
+        args: List[str],
+        timeout: int = 60,
+        working_dir: Optional[Path] = None,
+    ) -> DockerResult:
+        """Run a Docker command without blocking the event loop."""
+        cmd = ["docker"] + args
+        result = DockerResult(success=False, command=" ".join(cmd))
+
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                cwd=working_dir or self.working_dir,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+            except TimeoutError:
+                proc.kill()
+                await proc.wait()
+                result.error = "Command timed out"
+                return result
+
+            result.output = stdout.decode(errors="replace")
+            result.error = stderr.decode(errors="replace")
+            result.success = proc.returncode == 0
+
+        except FileNotFoundError:
+            result.error = "Docker not found"
+        except Exception as e:
+            result.error = str(e)
+
+        return result
+
+    async def _run_docker_many(self, arg_lists: List[List[str]]) -> List[DockerResult]:
+        """Run several Docker commands concurrently, at most 16 at a time."""
+        semaphore = asyncio.Semaphore(16)
+
+        async def run_one(args: List[str]) -> DockerResult:
+            async with semaphore:
+                return await self._run_docker_async(args)
+
+        self.invalidate_cache()
+        results = await asyncio.gather(*(run_one(args) for args in arg_lists))
+        self.invalidate_cache()
+        return list(results)
+
     def list_containers(self, all: bool = False) -> List[Container]:
         """
         List Docker containers.
@@ -130,6 +220,11 @@ class DockerTools:
         Returns:
             List of containers
         """
+        key = "containers:all" if all else "containers"
+        return list(self._cached(key, lambda: self._load_containers(all)) or [])
+
+    def _load_containers(self, all: bool) -> Optional[List[Container]]:
+        """Query containers from Docker, or None if the command failed."""
         args = ["ps", "--format", "{{json .}}"]
         if all:
             args.append("-a")
@@ -137,13 +232,13 @@ class DockerTools:
         result = self._run_docker(args)
 
         if not result.success:
-            return []
+            return None
 
         containers = []
-        for line in result.output.strip().split("\n"):
+        for line in result.output.splitlines():
             if line:
                 try:
-                    data = json.loads(line)
+                    data = _json_loads(line)
                     containers.append(Container.from_docker_json(data))
                 except json.JSONDecodeError:
                     pass
@@ -152,16 +247,20 @@ class DockerTools:
 
     def list_images(self) -> List[Image]:
         """List Docker images."""
+        return list(self._cached("images", self._load_images) or [])
+
+    def _load_images(self) -> Optional[List[Image]]:
+        """Query images from Docker, or None if the command failed."""
         result = self._run_docker(["images", "--format", "{{json .}}"])
 
         if not result.success:
-            return []
+            return None
 
         images = []
-        for line in result.output.strip().split("\n"):
+        for line in result.output.splitlines():
             if line:
                 try:
-                    data = json.loads(line)
+                    data = _json_loads(line)
                     images.append(Image.from_docker_json(data))
                 except json.JSONDecodeError:
                     pass
@@ -200,6 +299,7 @@ class DockerTools:
 
         args.append(context)
 
+        self.invalidate_cache()
         return self._run_docker(args, timeout=600)
 
     def run(
@@ -210,7 +310,7 @@ class DockerTools:
         volumes: Optional[Dict[str, str]] = None,
         env: Optional[Dict[str, str]] = None,
         detach: bool = True,
-        command: Optional[str] = None,
+        command: Optional[Union[str, List[str]]] = None,
     ) -> DockerResult:
         """
         Run a Docker container.
@@ -222,7 +322,8 @@ class DockerTools:
             volumes: Volume mappings (host:container)
             env: Environment variables
             detach: Run in background
-            command: Command to run
+            command: Command to run, as an argv list (a string is split
+                shell-style; kept for compatibility)
 
         Returns:
             DockerResult
@@ -250,16 +351,23 @@ class DockerTools:
         args.append(image)
 
         if command:
-            args.extend(command.split())
+            args.extend(_command_args(command))
 
+        self.invalidate_cache()
         return self._run_docker(args)
 
     def stop(self, container: str) -> DockerResult:
         """Stop a container."""
+        self.invalidate_cache()
         return self._run_docker(["stop", container])
 
+    async def stop_many(self, containers: List[str]) -> List[DockerResult]:
+        """Stop several containers concurrently."""
+        return await self._run_docker_many([["stop", c] for c in containers])
+
     def start(self, container: str) -> DockerResult:
         """Start a container."""
+        self.invalidate_cache()
         return self._run_docker(["start", container])
 
     def remove_container(self, container: str, force: bool = False) -> DockerResult:
@@ -268,26 +376,37 @@ class DockerTools:
         if force:
             args.append("-f")
         args.append(container)
+        self.invalidate_cache()
         return self._run_docker(args)
 
+    async def remove_many(self, containers: List[str], force: bool = False) -> List[DockerResult]:
+        """Remove several containers concurrently."""
+        flags = ["-f"] if force else []
+        return await self._run_docker_many([["rm", *flags, c] for c in containers])
+
     def remove_image(self, image: str, force: bool = False) -> DockerResult:
         """Remove an image."""
         args = ["rmi"]
         if force:
             args.append("-f")
         args.append(image)
+        self.invalidate_cache()
         return self._run_docker(args)
 
     def logs(self, container: str, tail: int = 100) -> DockerResult:
         """Get container logs."""
         return self._run_docker(["logs", "--tail", str(tail), container])
 
-    def exec(self, container: str, command: str) -> DockerResult:
-        """Execute command in container."""
-        return self._run_docker(["exec", container] + command.split())
+    def exec(self, container: str, command: Union[str, List[str]]) -> DockerResult:
+        """Execute command in container.
+
+        Pass the command as an argv list; a string is split shell-style.
+        """
+        return self._run_docker(["exec", container, *_command_args(command)])
 
     def pull(self, image: str) -> DockerResult:
         """Pull an image."""
+        self.invalidate_cache()
         return self._run_docker(["pull", image], timeout=300)
 
     def push(self, image: str) -> DockerResult:
@@ -320,6 +439,7 @@ class DockerTools:
         if build:
             args.append("--build")
 
+        self.invalidate_cache()
         return self._run_docker(args, timeout=300)
 
     def compose_down(self, file: str = "docker-compose.yml", volumes: bool = False) -> DockerResult:
@@ -329,6 +449,7 @@ class DockerTools:
         if volumes:
             args.append("-v")
 
+        self.invalidate_cache()
         return self._run_docker(args)
 
     def compose_ps(self, file: str = "docker-compose.yml") -> DockerResult:
@@ -349,15 +470,19 @@ class DockerTools:
 
     def get_info(self) -> Dict[str, Any]:
         """Get Docker system info."""
+        return dict(self._cached("info", self._load_info) or {})
+
+    def _load_info(self) -> Optional[Dict[str, Any]]:
+        """Query system info from Docker, or None if the command failed."""
         result = self._run_docker(["info", "--format", "{{json .}}"])
 
         if result.success:
             try:
-                return json.loads(result.output)
+                return _json_loads(result.output)
             except json.JSONDecodeError:
                 pass
 
-        return {}
+        return None
 
     def get_report(self) -> str:
         """Generate Docker report."""
@@ -372,8 +497,16 @@ class DockerTools:
             lines.append("=" * 60)
             return "\n".join(lines)
 
-        # Get info
-        info = self.get_info()
+        # The three queries are independent, so wait on them together
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            info_future = executor.submit(self.get_info)
+            containers_future = executor.submit(self.list_containers)
+            images_future = executor.submit(self.list_images)
+        info = info_future.result()
+        containers = containers_future.result()
+        images = images_future.result()
+
+        # Info
         if info:
             lines.append(f"Docker Version: {info.get('ServerVersion', 'Unknown')}")
             lines.append(f"Containers: {info.get('Containers', 0)} ({info.get('ContainersRunning', 0)} running)")
@@ -381,7 +514,6 @@ class DockerTools:
             lines.append("")
 
         # List running containers
-        containers = self.list_containers()
         lines.append(f"Running Containers ({len(containers)}):")
         if containers:
             for c in containers[:5]:
@@ -393,7 +525,6 @@ class DockerTools:
         lines.append("")
 
         # List images
-        images = self.list_images()
         lines.append(f"Images ({len(images)}):")
         if images:
             for i in images[:5]:
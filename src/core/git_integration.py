@@ -9,10 +9,24 @@ Advanced Git integration:
 
 import subprocess
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Tuple
-from dataclasses import dataclass, field
-from datetime import datetime
+from typing import Optional, List, Dict, Any, Tuple, Callable, Iterable
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta, timezone
+
+# In-process libgit2 backend (optional); the git CLI is used otherwise
+try:
+    import pygit2
+    from pygit2.enums import FileStatus, ReferenceType, SortMode
+    PYGIT2_AVAILABLE = True
+except ImportError:
+    PYGIT2_AVAILABLE = False
+
+_DIFFGIT_RE = re.compile(rb'^diff --git .* b/(.+)$', re.M)
+_CONFLICT_MARKER_RE = re.compile(rb'^(?:<{7}|={7}|>{7})', re.M)
 
 
 @dataclass
@@ -59,75 +73,254 @@ class GitIntegration:
     def __init__(self, working_dir: Optional[Path] = None):
         """Initialize Git integration."""
         self.working_dir = working_dir or Path.cwd()
+        # Long-running `git cat-file --batch`, started on first read_blob()
+        self._cat_file: Optional[subprocess.Popen] = None
+        self._cat_file_lock = threading.Lock()
+        # Query results: key -> (timestamp, repo state, value)
+        self._cache: Dict[str, Tuple[float, Tuple[int, ...], Any]] = {}
+        self._cache_ttl = 2.0
         self._check_git()
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+    def close(self):
+        """Stop the persistent cat-file process, if one is running."""
+        proc = getattr(self, "_cat_file", None)
+        if proc is None:
+            return
+        self._cat_file = None
+        try:
+            proc.stdin.close()
+            proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+
     def _check_git(self):
-        """Check if directory is a git repo."""
-        self.is_repo = (self.working_dir / ".git").exists()
+        """Locate the repository once with a single rev-parse.
+
+        Unlike checking for ./.git this also finds the repo from a
+        subdirectory, in worktrees and in submodules.
+        """
+        self.is_repo = False
+        self._repo = None
+        self.git_dir: Optional[Path] = None
+        self.common_dir: Optional[Path] = None
+        self.toplevel: Optional[Path] = None
+
+        success, output = self._run_git(
+            ["rev-parse", "--git-dir", "--git-common-dir", "--show-toplevel"]
+        )
+        lines = output.splitlines()
+        if not success or len(lines) != 3:
+            return
+
+        # Relative answers are relative to the directory git ran in
+        self.git_dir = (self.working_dir / lines[0]).resolve()
+        self.common_dir = (self.working_dir / lines[1]).resolve()
+        self.toplevel = Path(lines[2])
+        self.is_repo = True
+
+        if PYGIT2_AVAILABLE:
+            try:
+                self._repo = pygit2.Repository(str(self.toplevel))
+            except pygit2.GitError:
+                self._repo = None
+
+    def write_commit_graph(self) -> bool:
+        """Write a commit-graph if the repository has none (maintenance).
+
+        git log and branch queries walk the commit-graph instead of parsing
+        commit objects once it exists. This writes under .git/objects/info,
+        so it only runs when called explicitly. Returns True if a
+        commit-graph exists afterwards.
+        """
+        if not self.is_repo:
+            return False
+
+        info_dir = self.common_dir / "objects" / "info"
+        if (info_dir / "commit-graph").exists() or (info_dir / "commit-graphs").exists():
+            return True
+
+        success, _ = self._run_git_raw(
+            ["commit-graph", "write", "--reachable", "--changed-paths"], timeout=300
+        )
+        return success
 
     def _run_git(self, args: List[str], check: bool = True) -> Tuple[bool, str]:
         """Run a git command."""
+        success, output = self._run_git_raw(args, check)
+        return success, output.decode("utf-8", "replace")
+
+    def _run_git_raw(
+        self, args: List[str], check: bool = True, timeout: int = 30
+    ) -> Tuple[bool, bytes]:
+        """Run a git command and return its output undecoded."""
         try:
             result = subprocess.run(
                 ["git"] + args,
                 cwd=self.working_dir,
                 capture_output=True,
-                text=True,
-                timeout=30,
+                timeout=timeout,
             )
             if check and result.returncode != 0:
                 return False, result.stderr
             return True, result.stdout
         except subprocess.TimeoutExpired:
-            return False, "Command timed out"
+            return False, b"Command timed out"
         except FileNotFoundError:
-            return False, "Git not found"
+            return False, b"Git not found"
         except Exception as e:
-            return False, str(e)
+            return False, str(e).encode()
+
+    def _repo_state(self) -> Tuple[int, ...]:
+        """Cheap fingerprint of HEAD and refs via mtimes."""
+        state = []
+        for path in (
+            self.git_dir / "HEAD",
+            self.common_dir / "packed-refs",
+            self.common_dir / "refs" / "heads",
+        ):
+            try:
+                state.append(path.stat().st_mtime_ns)
+            except OSError:
+                state.append(0)
+        return tuple(state)
+
+    def _cached(self, key: str, loader: Callable[[], Any]) -> Any:
+        """Return a cached ref query (branches, log) while the repo state is unchanged.
+
+        The short TTL bounds staleness from ref updates the fingerprint
+        misses, such as refs in nested directories.
+        """
+        state = self._repo_state()
+        now = time.monotonic()
+        entry = self._cache.get(key)
+        if entry is not None and entry[1] == state and now - entry[0] < self._cache_ttl:
+            return entry[2]
+        value = loader()
+        self._cache[key] = (now, state, value)
+        return value
+
+    def invalidate_cache(self):
+        """Drop cached query results (call after mutating the repo)."""
+        self._cache.clear()
+
+    def read_blob(self, ref: str) -> Optional[bytes]:
+        """Read an object's content, e.g. "HEAD:src/app.py" or a blob sha.
+
+        Reuses one `git cat-file --batch` process across calls instead of
+        spawning git per object. Returns None if the object does not exist.
+        """
+        if not self.is_repo or "\n" in ref:
+            return None
+
+        with self._cat_file_lock:
+            try:
+                if self._cat_file is None or self._cat_file.poll() is not None:
+                    self._cat_file = subprocess.Popen(
+                        ["git", "cat-file", "--batch"],
+                        cwd=self.working_dir,
+                        stdin=subprocess.PIPE,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.DEVNULL,
+                    )
+                proc = self._cat_file
+                proc.stdin.write(ref.encode("utf-8") + b"\n")
+                proc.stdin.flush()
+
+                # Reply is "<sha> <type> <size>\n<content>\n" or "<ref> missing\n"
+                header = proc.stdout.readline().split()
+                if len(header) != 3:
+                    return None
+                content = proc.stdout.read(int(header[2]))
+                proc.stdout.read(1)
+                return content
+            except (OSError, ValueError):
+                self.close()
+                return None
+
+    def _load_status(self) -> GitStatus:
+        """Query working tree status from git."""
+        if self._repo is not None:
+            try:
+                return self._pygit2_status()
+            except (pygit2.GitError, KeyError, ValueError):
+                pass  # Fall back to the git CLI
+
+        # --no-optional-locks stops status from rewriting the index
+        return self._parse_status(*self._run_git_raw([
+            "--no-optional-locks", "status", "--porcelain=v2", "--branch", "-z",
+        ]))
 
     def get_status(self) -> GitStatus:
-        """Get repository status."""
-        status = GitStatus()
+        """Get repository status.
 
+        Not cached: editing a tracked file changes nothing git's refs or
+        index fingerprint can see.
+        """
         if not self.is_repo:
-            return status
-
-        status.is_repo = True
-
-        # Get branch
-        success, output = self._run_git(["branch", "--show-current"])
-        if success:
-            status.branch = output.strip()
-
-        # Get status
-        success, output = self._run_git(["status", "--porcelain", "-b"])
+            return GitStatus()
+        return self._load_status()
+
+    def _collect_repo_snapshot(self) -> Tuple[GitStatus, List[GitBranch]]:
+        """Query status and branches together for one report.
+
+        With the git CLI the status and for-each-ref calls run side by side;
+        libgit2 answers in-process, so the two queries simply run in turn.
+        Never cached, so the snapshot always reflects the working tree.
+        """
+        if self._repo is not None:
+            return self._load_status(), self._load_branches()
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            status_future = executor.submit(self._load_status)
+            branches_future = executor.submit(self._load_branches)
+        return status_future.result(), branches_future.result()
+
+    def _parse_status(self, success: bool, output: bytes) -> GitStatus:
+        """Parse `git status --porcelain=v2 --branch -z` output."""
+        status = GitStatus(is_repo=True)
+
+        # One porcelain v2 call reports branch, ahead/behind and entries;
+        # -z keeps paths unquoted and NUL-separated. Records stay bytes and
+        # only the fields kept in GitStatus are decoded.
         if success:
-            lines = output.strip().splitlines()
-            for line in lines:
-                if line.startswith("##"):
-                    # Parse branch info
-                    if "ahead" in line:
-                        match = re.search(r'ahead (\d+)', line)
-                        if match:
-                            status.ahead = int(match.group(1))
-                    if "behind" in line:
-                        match = re.search(r'behind (\d+)', line)
-                        if match:
-                            status.behind = int(match.group(1))
-                elif line:
-                    code = line[:2]
-                    filepath = line[3:]
-
-                    if code[0] in ('M', 'A', 'D', 'R', 'C'):
+            records = iter(output.split(b"\0"))
+            for record in records:
+                if record.startswith(b"# "):
+                    key, _, value = record[2:].partition(b" ")
+                    if key == b"branch.head":
+                        status.branch = "" if value == b"(detached)" else value.decode("utf-8", "replace")
+                    elif key == b"branch.ab":
+                        ahead, behind = value.split()
+                        status.ahead = int(ahead[1:])
+                        status.behind = int(behind[1:])
+                elif record.startswith(b"? "):
+                    status.untracked.append(record[2:].decode("utf-8", "replace"))
+                elif record.startswith(b"u "):
+                    status.conflicted.append(record.split(b" ", 10)[10].decode("utf-8", "replace"))
+                elif record.startswith((b"1 ", b"2 ")):
+                    index_code = record[2:3]
+                    worktree_code = record[3:4]
+                    if record.startswith(b"1"):
+                        filepath = record.split(b" ", 8)[8].decode("utf-8", "replace")
+                    else:
+                        filepath = record.split(b" ", 9)[9].decode("utf-8", "replace")
+                        next(records, None)  # Original path of the rename/copy
+
+                    if index_code in (b"M", b"A", b"D", b"R", b"C"):
                         status.staged.append(filepath)
-                    if code[1] == 'M':
+                    if worktree_code == b"M":
                         status.modified.append(filepath)
-                    elif code[1] == 'D':
+                    elif worktree_code == b"D":
                         status.deleted.append(filepath)
-                    elif code == '??':
-                        status.untracked.append(filepath)
-                    elif code == 'UU':
-                        status.conflicted.append(filepath)
 
         status.is_clean = not (status.staged or status.modified or
                                status.untracked or status.deleted or status.conflicted)
@@ -136,10 +329,19 @@ class GitIntegration:
 
     def get_log(self, limit: int = 10) -> List[GitCommit]:
         """Get recent commits."""
-        commits = []
-
         if not self.is_repo:
-            return commits
+            return []
+        return [replace(c) for c in self._cached(f"log:{limit}", lambda: self._load_log(limit))]
+
+    def _load_log(self, limit: int) -> List[GitCommit]:
+        """Query recent commits from git."""
+        if self._repo is not None:
+            try:
+                return self._pygit2_log(limit)
+            except (pygit2.GitError, KeyError, ValueError):
+                pass  # Fall back to the git CLI
+
+        commits = []
 
         success, output = self._run_git([
             "log", f"-{limit}",
@@ -163,31 +365,128 @@ class GitIntegration:
 
     def get_branches(self) -> List[GitBranch]:
         """Get all branches."""
-        branches = []
-
         if not self.is_repo:
-            return branches
+            return []
+        return [replace(b) for b in self._cached("branches", self._load_branches)]
+
+    def _load_branches(self) -> List[GitBranch]:
+        """Query local and remote branches from git."""
+        if self._repo is not None:
+            try:
+                return self._pygit2_branches()
+            except (pygit2.GitError, KeyError, ValueError):
+                pass  # Fall back to the git CLI
+
+        return self._parse_branches(*self._run_git_raw([
+            "for-each-ref",
+            "--format=%(HEAD)%09%(refname)%09%(objectname:short)%09%(symref)",
+            "refs/heads", "refs/remotes",
+        ]))
+
+    def _parse_branches(self, success: bool, output: bytes) -> List[GitBranch]:
+        """Parse tab-separated `git for-each-ref` output for heads and remotes."""
+        branches = []
 
-        success, output = self._run_git(["branch", "-a", "-v"])
         if success:
-            for line in output.strip().splitlines():
-                is_current = line.startswith("*")
-                line = line.lstrip("* ").strip()
-
-                parts = line.split(None, 2)
-                if len(parts) >= 2:
-                    name = parts[0]
-                    is_remote = name.startswith("remotes/")
-
-                    branches.append(GitBranch(
-                        name=name.replace("remotes/", ""),
-                        is_current=is_current,
-                        is_remote=is_remote,
-                        last_commit=parts[1] if len(parts) > 1 else "",
-                    ))
+            for line in output.decode("utf-8", "replace").splitlines():
+                parts = line.split("\t")
+                if len(parts) != 4 or parts[3]:
+                    continue  # Skip symbolic refs such as origin/HEAD
+
+                head, refname, short_hash, _ = parts
+                is_remote = refname.startswith("refs/remotes/")
+                branches.append(GitBranch(
+                    name=refname[len("refs/remotes/" if is_remote else "refs/heads/"):],
+                    is_current=head == "*",
+                    is_remote=is_remote,
+                    last_commit=short_hash,
+                ))
 
         return branches
 
+    def _pygit2_status(self) -> GitStatus:
+        """Build GitStatus from libgit2 (no rename detection)."""
+        repo = self._repo
+        status = GitStatus(is_repo=True)
+
+        if not repo.head_is_detached:
+            # HEAD names the branch even before its first commit
+            status.branch = repo.references["HEAD"].target.removeprefix("refs/heads/")
+            branch = repo.branches.local.get(status.branch)
+            upstream = branch.upstream if branch is not None else None
+            if upstream is not None:
+                status.ahead, status.behind = repo.ahead_behind(branch.target, upstream.target)
+
+        staged_flags = (FileStatus.INDEX_NEW | FileStatus.INDEX_MODIFIED |
+                        FileStatus.INDEX_DELETED | FileStatus.INDEX_RENAMED)
+        for filepath, flags in repo.status(untracked_files="normal").items():
+            if flags & FileStatus.CONFLICTED:
+                status.conflicted.append(filepath)
+            elif flags & FileStatus.WT_NEW:
+                status.untracked.append(filepath)
+            else:
+                if flags & staged_flags:
+                    status.staged.append(filepath)
+                if flags & FileStatus.WT_MODIFIED:
+                    status.modified.append(filepath)
+                elif flags & FileStatus.WT_DELETED:
+                    status.deleted.append(filepath)
+
+        status.is_clean = not (status.staged or status.modified or
+                               status.untracked or status.deleted or status.conflicted)
+        return status
+
+    def _pygit2_branches(self) -> List[GitBranch]:
+        """List local and remote branches from libgit2, in refname order."""
+        repo = self._repo
+        branches = []
+
+        for name in sorted(repo.branches.local):
+            branch = repo.branches.local[name]
+            branches.append(GitBranch(
+                name=name,
+                is_current=branch.is_head(),
+                last_commit=str(branch.target)[:7],
+            ))
+
+        for name in sorted(repo.branches.remote):
+            branch = repo.branches.remote[name]
+            if branch.type == ReferenceType.SYMBOLIC:
+                continue  # Skip symbolic refs such as origin/HEAD
+            branches.append(GitBranch(
+                name=name,
+                is_remote=True,
+                last_commit=str(branch.target)[:7],
+            ))
+
+        return branches
+
+    def _pygit2_log(self, limit: int) -> List[GitCommit]:
+        """Walk recent commits from HEAD with libgit2."""
+        repo = self._repo
+        commits = []
+
+        if repo.head_is_unborn:
+            return commits
+
+        for commit in repo.walk(repo.head.target, SortMode.TIME):
+            if len(commits) >= limit:
+                break
+            author = commit.author
+            tz = timezone(timedelta(minutes=author.offset))
+            # Like %s: the first paragraph of the message on one line
+            subject = " ".join(commit.message.split("\n\n", 1)[0].split())
+            commits.append(GitCommit(
+                hash=str(commit.id),
+                short_hash=commit.short_id,
+                author=author.name,
+                email=author.email,
+                date=datetime.fromtimestamp(author.time, tz).strftime("%Y-%m-%d %H:%M:%S %z"),
+                message=subject,
+            ))
+
+        return commits
+
     def get_diff(self, staged: bool = False, file: Optional[str] = None) -> str:
         """Get diff output."""
         if not self.is_repo:
@@ -207,33 +506,17 @@ class GitIntegration:
         if not self.is_repo:
             return ""
 
-        if diff is None:
-            diff = self.get_diff(staged=True)
-            if not diff:
-                diff = self.get_diff()
+        if diff is not None:
+            summary = self._summarize_diff([diff.encode("utf-8", "replace")])
+        else:
+            # numstat carries just the per-file counts, not the diff text
+            summary = self._summarize_numstat(["diff", "--staged"])
+            if summary is None:
+                summary = self._summarize_numstat(["diff"])
 
-        if not diff:
+        if summary is None:
             return ""
-
-        # Analyze changes
-        files_changed = set()
-        additions = 0
-        deletions = 0
-        file_types = set()
-
-        for line in diff.splitlines():
-            if line.startswith("diff --git"):
-                match = re.search(r'b/(.+)$', line)
-                if match:
-                    filepath = match.group(1)
-                    files_changed.add(filepath)
-                    ext = Path(filepath).suffix
-                    if ext:
-                        file_types.add(ext)
-            elif line.startswith("+") and not line.startswith("+++"):
-                additions += 1
-            elif line.startswith("-") and not line.startswith("---"):
-                deletions += 1
+        files_changed, additions, deletions, file_types = summary
 
         # Generate message
         if len(files_changed) == 1:
@@ -256,12 +539,79 @@ class GitIntegration:
         else:
             return f"Update {len(files_changed)} files"
 
-    def smart_commit(self, message: Optional[str] = None) -> Tuple[bool, str]:
-        """Perform a smart commit."""
+    def _summarize_diff(self, blocks: Iterable[bytes]) -> Optional[Tuple[set, int, int, set]]:
+        """Count files, additions and deletions in diff output; None if empty.
+
+        Each block must hold whole lines. Lines are counted with bytes.count
+        rather than visited one by one; only `diff --git` headers are parsed.
+        """
+        files_changed = set()
+        additions = 0
+        deletions = 0
+        file_types = set()
+        seen = False
+
+        for block in blocks:
+            if not block:
+                continue
+            seen = True
+            block = b"\n" + block
+            additions += block.count(b"\n+") - block.count(b"\n+++")
+            deletions += block.count(b"\n-") - block.count(b"\n---")
+            for match in _DIFFGIT_RE.finditer(block):
+                filepath = match.group(1).decode("utf-8", "replace")
+                files_changed.add(filepath)
+                ext = Path(filepath).suffix
+                if ext:
+                    file_types.add(ext)
+
+        if not seen:
+            return None
+        return files_changed, additions, deletions, file_types
+
+    def _summarize_numstat(self, args: List[str]) -> Optional[Tuple[set, int, int, set]]:
+        """Like _summarize_diff, from `git diff --numstat -z` records."""
+        success, output = self._run_git_raw(args + ["--numstat", "-z"])
+        if not success or not output:
+            return None
+
+        files_changed = set()
+        additions = 0
+        deletions = 0
+        file_types = set()
+
+        # Records are "add\tdel\tpath\0", or "add\tdel\t\0old\0new\0" for
+        # renames; binary files report "-" for both counts
+        fields = output.split(b"\0")
+        i = 0
+        while i < len(fields):
+            record = fields[i]
+            i += 1
+            if not record:
+                continue
+            added, deleted, path = record.split(b"\t", 2)
+            if not path and i + 1 < len(fields):
+                path = fields[i + 1]
+                i += 2
+            if added != b"-":
+                additions += int(added)
+                deletions += int(deleted)
+            filepath = path.decode("utf-8", "replace")
+            files_changed.add(filepath)
+            ext = Path(filepath).suffix
+            if ext:
+                file_types.add(ext)
+
+        return files_changed, additions, deletions, file_types
+
+    def smart_commit(self, message: Optional[str] = None,
+                     status: Optional[GitStatus] = None) -> Tuple[bool, str]:
+        """Perform a smart commit, reusing `status` if the caller has one."""
         if not self.is_repo:
             return False, "Not a git repository"
 
-        status = self.get_status()
+        if status is None:
+            status = self.get_status()
         if status.is_clean:
             return False, "Nothing to commit"
 
@@ -271,11 +621,25 @@ class GitIntegration:
 
         # Stage modified files if nothing staged
         if not status.staged and status.modified:
-            for file in status.modified:
-                self._run_git(["add", file])
+            self._stage_many(status.modified)
 
+        self.invalidate_cache()
         return self._run_git(["commit", "-m", message])
 
+    def _stage_many(self, files: List[str]) -> Tuple[bool, str]:
+        """Stage several files, batching paths to stay under argv limits."""
+        files = list(files)
+        success, output = True, ""
+        self.invalidate_cache()
+        for start in range(0, len(files), 1000):
+            # Status paths are relative to the top level, not working_dir
+            success, output = self._run_git(
+                ["-C", str(self.toplevel), "add", "--"] + files[start:start + 1000]
+            )
+            if not success:
+                break
+        return success, output
+
     def get_branch_tree(self) -> str:
         """Generate ASCII branch tree."""
         if not self.is_repo:
@@ -303,59 +667,84 @@ class GitIntegration:
 
         return "\n".join(lines)
 
-    def get_conflict_files(self) -> List[Dict[str, Any]]:
-        """Get files with merge conflicts."""
+    def get_conflict_files(self, status: Optional[GitStatus] = None) -> List[Dict[str, Any]]:
+        """Get files with merge conflicts, reusing `status` if the caller has one."""
         conflicts = []
 
         if not self.is_repo:
             return conflicts
 
-        status = self.get_status()
+        if status is None:
+            status = self.get_status()
         for filepath in status.conflicted:
-            full_path = self.working_dir / filepath
+            full_path = self.toplevel / filepath
             if full_path.exists():
                 try:
-                    content = full_path.read_text(encoding='utf-8')
-                    # Find conflict markers
-                    ours = []
-                    theirs = []
-                    in_ours = False
-                    in_theirs = False
-
-                    for i, line in enumerate(content.splitlines(), 1):
-                        if line.startswith("<<<<<<<"):
-                            in_ours = True
-                        elif line.startswith("======="):
-                            in_ours = False
-                            in_theirs = True
-                        elif line.startswith(">>>>>>>"):
-                            in_theirs = False
-                        elif in_ours:
-                            ours.append((i, line))
-                        elif in_theirs:
-                            theirs.append((i, line))
-
+                    ours_changes, theirs_changes = self._count_conflict_lines(full_path.read_bytes())
                     conflicts.append({
                         "file": filepath,
-                        "ours_changes": len(ours),
-                        "theirs_changes": len(theirs),
+                        "ours_changes": ours_changes,
+                        "theirs_changes": theirs_changes,
                     })
-                except (IOError, UnicodeDecodeError):
+                except OSError:
                     conflicts.append({"file": filepath, "error": "Could not read"})
 
         return conflicts
 
+    @staticmethod
+    def _count_conflict_lines(content: bytes) -> Tuple[int, int]:
+        """Count lines on our and their side of every conflict block.
+
+        Only marker lines are visited; the lines between two markers are
+        counted in one bytes.count call.
+        """
+        ours = theirs = 0
+        side = None
+        start = 0
+        for match in _CONFLICT_MARKER_RE.finditer(content):
+            if side is not None:
+                lines = content.count(b"\n", start, match.start())
+                if side == "ours":
+                    ours += lines
+                else:
+                    theirs += lines
+
+            marker = match.group()
+            if marker == b"<<<<<<<":
+                side = "ours"
+            elif marker == b"=======":
+                side = "theirs" if side == "ours" else None
+            else:
+                side = None
+
+            end = content.find(b"\n", match.end())
+            start = len(content) if end == -1 else end + 1
+
+        if side is not None:
+            # Unterminated block: count through the end of the file
+            lines = content.count(b"\n", start)
+            if not content.endswith(b"\n") and start < len(content):
+                lines += 1
+            if side == "ours":
+                ours += lines
+            else:
+                theirs += lines
+
+        return ours, theirs
+
     def get_status_report(self) -> str:
         """Generate a status report."""
-        status = self.get_status()
-
-        if not status.is_repo:
+        if not self.is_repo:
             return "Not a git repository"
 
+        status, branches = self._collect_repo_snapshot()
+        remote_count = sum(1 for b in branches if b.is_remote)
+
         lines = []
         lines.append("Git Status Report")
         lines.append("=" * 40)
         lines.append(f"\nBranch: {status.branch}")
+        lines.append(f"  Branches: {len(branches) - remote_count} local, {remote_count} remote")
 
         if status.ahead:
             lines.append(f"  Ahead by {status.ahead} commits")
@@ -397,22 +786,39 @@ def get_git_integration(working_dir: Optional[Path] = None) -> GitIntegration:
     return _git_integration
 
 
-# Convenience functions
+# Convenience functions share one instance per directory so their caches
+# persist; each may hold a cat-file process, so only the most recent are kept
+_instances: Dict[Path, GitIntegration] = {}
+_MAX_INSTANCES = 8
+
+
+def _integration_for(working_dir: Optional[Path]) -> GitIntegration:
+    """Get the shared GitIntegration for a directory."""
+    working_dir = working_dir or Path.cwd()
+    gi = _instances.pop(working_dir, None)
+    if gi is None:
+        gi = GitIntegration(working_dir)
+        if len(_instances) >= _MAX_INSTANCES:
+            _instances.pop(next(iter(_instances))).close()
+    _instances[working_dir] = gi  # Most recently used last
+    return gi
+
+
 def git_status(working_dir: Optional[Path] = None) -> GitStatus:
     """Get git status."""
-    return GitIntegration(working_dir or Path.cwd()).get_status()
+    return _integration_for(working_dir).get_status()
 
 
 def git_log(limit: int = 10, working_dir: Optional[Path] = None) -> List[GitCommit]:
     """Get git log."""
-    return GitIntegration(working_dir or Path.cwd()).get_log(limit)
+    return _integration_for(working_dir).get_log(limit)
 
 
 def git_diff(staged: bool = False, working_dir: Optional[Path] = None) -> str:
     """Get git diff."""
-    return GitIntegration(working_dir or Path.cwd()).get_diff(staged)
+    return _integration_for(working_dir).get_diff(staged)
 
 
 def git_status_report(working_dir: Optional[Path] = None) -> str:
     """Get git status report."""
-    return GitIntegration(working_dir or Path.cwd()).get_status_report()
+    return _integration_for(working_dir).get_status_report()
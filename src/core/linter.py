@@ -7,13 +7,37 @@ Integrate with popular linters:
 - Rust: clippy
 """
 
+import asyncio
+import os
+import shutil
 import subprocess
 import json
+import re
+import time
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
+# Linter JSON reports can be large; parse them with orjson when installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Directories never descended into when looking for source files
+_IGNORED_DIRS = frozenset({"node_modules", "__pycache__", "venv", "dist", "build"})
+
+# Pattern: file:line: error: message
+_MYPY_RE = re.compile(r"([^:]+):(\d+):\s*(error|warning|note):\s*(.+)")
+
+# Common "file:line..." shapes, tried in order
+_GENERIC_PATTERNS = (
+    re.compile(r"([^:]+):(\d+):(\d+):\s*(\w+):\s*(.+)"),  # file:line:col: type: msg
+    re.compile(r"([^:]+):(\d+):\s*(\w+):\s*(.+)"),  # file:line: type: msg
+    re.compile(r"([^:]+)\((\d+)\):\s*(.+)"),  # file(line): msg
+)
+
 
 class LinterType(Enum):
     """Supported linters."""
@@ -106,46 +130,55 @@ class LinterIntegration:
         },
     }
 
+    # Command lookups shared by all instances, keyed by (PATH, command)
+    _which_cache: Dict[Tuple[str, str], bool] = {}
+
+    # Project recommendations shared by all instances, keyed by (working_dir, PATH)
+    _project_linters_cache: Dict[Tuple[str, str], List[LinterType]] = {}
+
     def __init__(self, working_dir: Optional[Path] = None):
         """Initialize linter integration."""
         self.working_dir = working_dir or Path.cwd()
+        self._source_extensions: Optional[Set[str]] = None
 
     def detect_available_linters(self) -> List[LinterType]:
         """Detect which linters are available."""
-        available = []
-
-        for linter, config in self.LINTER_CONFIGS.items():
-            cmd = config["command"][0]
-            try:
-                subprocess.run(
-                    [cmd, "--version"],
-                    capture_output=True,
-                    timeout=5,
-                )
-                available.append(linter)
-            except (subprocess.SubprocessError, FileNotFoundError):
-                pass
-
-        return available
+        return [
+            linter for linter, config in self.LINTER_CONFIGS.items()
+            if self._is_available(config["command"][0])
+        ]
 
     def detect_project_linters(self) -> List[LinterType]:
-        """Detect recommended linters for project."""
+        """Detect recommended linters for project.
+
+        The result is remembered per project directory until PATH changes,
+        so repeated lint() calls skip the tree walk and lookups.
+        """
+        key = (str(self.working_dir.resolve()), os.environ.get("PATH", ""))
+        recommended = self._project_linters_cache.get(key)
+        if recommended is None:
+            recommended = LinterIntegration._project_linters_cache[key] = self._detect_project_linters()
+        return list(recommended)
+
+    def _detect_project_linters(self) -> List[LinterType]:
+        """Recommend linters from the project's source files and PATH."""
         recommended = []
+        found = self._find_source_extensions()
 
         # Check for Python
-        if list(self.working_dir.glob("**/*.py")):
+        if ".py" in found:
             if self._is_available("ruff"):
                 recommended.append(LinterType.RUFF)
             elif self._is_available("flake8"):
                 recommended.append(LinterType.FLAKE8)
 
         # Check for JavaScript/TypeScript
-        if list(self.working_dir.glob("**/*.js")) or list(self.working_dir.glob("**/*.ts")):
+        if ".js" in found or ".ts" in found:
             if self._is_available("eslint"):
                 recommended.append(LinterType.ESLINT)
 
         # Check for Go
-        if list(self.working_dir.glob("**/*.go")):
+        if ".go" in found:
             if self._is_available("golangci-lint"):
                 recommended.append(LinterType.GOLANGCI_LINT)
 
@@ -156,17 +189,34 @@ class LinterIntegration:
 
         return recommended
 
+    def _find_source_extensions(self) -> Set[str]:
+        """Find which of .py/.js/.ts/.go occur in the tree, in one walk.
+
+        Hidden and vendored directories are skipped, and the walk stops as
+        soon as all four have been seen; the answer is cached on the instance.
+        """
+        if self._source_extensions is None:
+            wanted = {".py", ".js", ".ts", ".go"}
+            found = set()
+            for _, dirs, files in os.walk(self.working_dir):
+                # Prune hidden, vendored and build directories in place
+                dirs[:] = [d for d in dirs if not d.startswith(".") and d not in _IGNORED_DIRS]
+                for name in files:
+                    ext = os.path.splitext(name)[1]
+                    if ext in wanted:
+                        found.add(ext)
+                if found == wanted:
+                    break
+            self._source_extensions = found
+        return self._source_extensions
+
     def _is_available(self, command: str) -> bool:
-        """Check if a command is available."""
-        try:
-            subprocess.run(
-                [command, "--version"],
-                capture_output=True,
-                timeout=5,
-            )
-            return True
-        except (subprocess.SubprocessError, FileNotFoundError):
-            return False
+        """Check if a command is on PATH (a lookup, no process spawn)."""
+        key = (os.environ.get("PATH", ""), command)
+        found = self._which_cache.get(key)
+        if found is None:
+            found = LinterIntegration._which_cache[key] = shutil.which(command) is not None
+        return found
 
     def lint(
         self,
@@ -185,7 +235,6 @@ class LinterIntegration:
         Returns:
             LintResult with issues
         """
-        import time
         start_time = time.time()
 
         # Auto-detect linter if not specified
@@ -199,54 +248,21 @@ class LinterIntegration:
                 )
             linter = available[0]
 
-        config = self.LINTER_CONFIGS.get(linter)
-        if not config:
-            return LintResult(
-                linter=linter.value,
-                success=False,
-                message=f"Unknown linter: {linter.value}"
-            )
-
-        target = str(path or self.working_dir)
-
-        # Run linter
-        if fix and "fix_command" in config:
-            cmd = config["fix_command"] + [target]
-        else:
-            cmd = config["command"] + [target]
-
         result = LintResult(linter=linter.value, success=True)
+        cmd = self._build_command(linter, path, fix)
+        if cmd is None:
+            result.success = False
+            result.message = f"Unknown linter: {linter.value}"
+            return result
 
         try:
             proc = subprocess.run(
                 cmd,
                 cwd=self.working_dir,
                 capture_output=True,
-                text=True,
                 timeout=120,
             )
-
-            # Parse output based on linter
-            if linter == LinterType.RUFF:
-                result.issues = self._parse_ruff_output(proc.stdout)
-            elif linter == LinterType.ESLINT:
-                result.issues = self._parse_eslint_output(proc.stdout)
-            elif linter == LinterType.MYPY:
-                result.issues = self._parse_mypy_output(proc.stdout)
-            elif linter == LinterType.GOLANGCI_LINT:
-                result.issues = self._parse_golangci_output(proc.stdout)
-            else:
-                # Generic parsing
-                result.issues = self._parse_generic_output(proc.stdout, linter.value)
-
-            # Count by severity
-            for issue in result.issues:
-                if issue.severity == IssueSeverity.ERROR:
-                    result.error_count += 1
-                elif issue.severity == IssueSeverity.WARNING:
-                    result.warning_count += 1
-                else:
-                    result.info_count += 1
+            self._collect_issues(result, linter, proc.stdout)
 
         except subprocess.TimeoutExpired:
             result.success = False
@@ -261,13 +277,127 @@ class LinterIntegration:
         result.execution_time = time.time() - start_time
         return result
 
-    def _parse_ruff_output(self, output: str) -> List[LintIssue]:
+    async def lint_many(
+        self,
+        linters: List[LinterType],
+        path: Optional[Path] = None,
+        fix: bool = False,
+    ) -> List[LintResult]:
+        """
+        Run several linters concurrently.
+
+        Args:
+            linters: Linters to run
+            path: Path to lint (default: working_dir)
+            fix: Attempt to auto-fix issues
+
+        Returns:
+            One LintResult per linter, in the given order
+        """
+        return list(await asyncio.gather(
+            *(self._lint_async(linter, path, fix) for linter in linters)
+        ))
+
+    def lint_all(
+        self,
+        linters: List[LinterType],
+        path: Optional[Path] = None,
+        fix: bool = False,
+    ) -> List[LintResult]:
+        """Run several linters concurrently (blocking wrapper for lint_many)."""
+        return asyncio.run(self.lint_many(linters, path, fix))
+
+    async def _lint_async(
+        self,
+        linter: LinterType,
+        path: Optional[Path],
+        fix: bool,
+    ) -> LintResult:
+        """Run one linter as an asyncio subprocess."""
+        start_time = time.time()
+        result = LintResult(linter=linter.value, success=True)
+        cmd = self._build_command(linter, path, fix)
+        if cmd is None:
+            result.success = False
+            result.message = f"Unknown linter: {linter.value}"
+            return result
+
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                cwd=self.working_dir,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            try:
+                stdout, _ = await asyncio.wait_for(proc.communicate(), 120)
+            except TimeoutError:
+                proc.kill()
+                await proc.wait()
+                result.success = False
+                result.message = "Linter timed out"
+            else:
+                self._collect_issues(result, linter, stdout)
+
+        except FileNotFoundError:
+            result.success = False
+            result.message = f"Linter '{linter.value}' not found"
+        except Exception as e:
+            result.success = False
+            result.message = str(e)
+
+        result.execution_time = time.time() - start_time
+        return result
+
+    def _build_command(
+        self,
+        linter: LinterType,
+        path: Optional[Path],
+        fix: bool,
+    ) -> Optional[List[str]]:
+        """Build the linter command line, or None for an unknown linter."""
+        config = self.LINTER_CONFIGS.get(linter)
+        if not config:
+            return None
+
+        target = str(path or self.working_dir)
+        if fix and "fix_command" in config:
+            return config["fix_command"] + [target]
+        return config["command"] + [target]
+
+    def _collect_issues(self, result: LintResult, linter: LinterType, output: bytes):
+        """Parse raw linter output into result.issues and count by severity.
+
+        JSON reports are parsed straight from bytes; only line-oriented
+        output is decoded.
+        """
+        if linter == LinterType.RUFF:
+            result.issues = self._parse_ruff_output(output)
+        elif linter == LinterType.ESLINT:
+            result.issues = self._parse_eslint_output(output)
+        elif linter == LinterType.MYPY:
+            result.issues = self._parse_mypy_output(output.decode("utf-8", "replace"))
+        elif linter == LinterType.GOLANGCI_LINT:
+            result.issues = self._parse_golangci_output(output)
+        else:
+            # Generic parsing
+            result.issues = self._parse_generic_output(output.decode("utf-8", "replace"), linter.value)
+
+        for issue in result.issues:
+            if issue.severity == IssueSeverity.ERROR:
+                result.error_count += 1
+            elif issue.severity == IssueSeverity.WARNING:
+                result.warning_count += 1
+            else:
+                result.info_count += 1
+
+    def _parse_ruff_output(self, output: bytes) -> List[LintIssue]:
         """Parse ruff JSON output."""
         issues = []
         try:
             if not output.strip():
                 return issues
-            data = json.loads(output)
+            data = _json_loads(output)
             for item in data:
                 issues.append(LintIssue(
                     file_path=item.get("filename", ""),
@@ -279,17 +409,17 @@ class LinterIntegration:
                     linter="ruff",
                     fixable=item.get("fix") is not None,
                 ))
-        except json.JSONDecodeError:
+        except (json.JSONDecodeError, UnicodeDecodeError):
             pass
         return issues
 
-    def _parse_eslint_output(self, output: str) -> List[LintIssue]:
+    def _parse_eslint_output(self, output: bytes) -> List[LintIssue]:
         """Parse eslint JSON output."""
         issues = []
         try:
             if not output.strip():
                 return issues
-            data = json.loads(output)
+            data = _json_loads(output)
             for file_data in data:
                 file_path = file_data.get("filePath", "")
                 for msg in file_data.get("messages", []):
@@ -304,18 +434,16 @@ class LinterIntegration:
                         linter="eslint",
                         fixable=msg.get("fix") is not None,
                     ))
-        except json.JSONDecodeError:
+        except (json.JSONDecodeError, UnicodeDecodeError):
             pass
         return issues
 
     def _parse_mypy_output(self, output: str) -> List[LintIssue]:
         """Parse mypy output."""
         issues = []
-        import re
 
         for line in output.splitlines():
-            # Pattern: file:line: error: message
-            match = re.match(r"([^:]+):(\d+):\s*(error|warning|note):\s*(.+)", line)
+            match = _MYPY_RE.match(line)
             if match:
                 severity_map = {
                     "error": IssueSeverity.ERROR,
@@ -334,13 +462,13 @@ class LinterIntegration:
 
         return issues
 
-    def _parse_golangci_output(self, output: str) -> List[LintIssue]:
+    def _parse_golangci_output(self, output: bytes) -> List[LintIssue]:
         """Parse golangci-lint JSON output."""
         issues = []
         try:
             if not output.strip():
                 return issues
-            data = json.loads(output)
+            data = _json_loads(output)
             for item in data.get("Issues", []):
                 pos = item.get("Pos", {})
                 issues.append(LintIssue(
@@ -352,25 +480,18 @@ class LinterIntegration:
                     severity=IssueSeverity.WARNING,
                     linter="golangci-lint",
                 ))
-        except json.JSONDecodeError:
+        except (json.JSONDecodeError, UnicodeDecodeError):
             pass
         return issues
 
     def _parse_generic_output(self, output: str, linter: str) -> List[LintIssue]:
         """Parse generic linter output."""
         issues = []
-        import re
 
         for line in output.splitlines():
             # Try common patterns
-            patterns = [
-                r"([^:]+):(\d+):(\d+):\s*(\w+):\s*(.+)",  # file:line:col: type: msg
-                r"([^:]+):(\d+):\s*(\w+):\s*(.+)",  # file:line: type: msg
-                r"([^:]+)\((\d+)\):\s*(.+)",  # file(line): msg
-            ]
-
-            for pattern in patterns:
-                match = re.match(pattern, line)
+            for pattern in _GENERIC_PATTERNS:
+                match = pattern.match(line)
                 if match:
                     groups = match.groups()
                     issues.append(LintIssue(
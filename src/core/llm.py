@@ -1,11 +1,32 @@
 """LLM integration supporting Ollama and Anthropic Claude."""
 
+import os
+from functools import lru_cache
+
 from agno.models.ollama import Ollama
 from agno.models.anthropic import Claude
+from anthropic import Anthropic as AnthropicClient
+from ollama import Client as OllamaClient
 
 from src.config.settings import get_settings
 
 
+# Model objects are configured per agent (tools, response format), so each
+# call builds a new one; the HTTP clients underneath are shared so requests
+# reuse pooled keep-alive connections.
+
+@lru_cache(maxsize=16)
+def _ollama_client(host: str, timeout: float | None) -> OllamaClient:
+    """Get the shared Ollama client for a host."""
+    return OllamaClient(host=host, timeout=timeout)
+
+
+@lru_cache(maxsize=16)
+def _anthropic_client(api_key: str) -> AnthropicClient:
+    """Get the shared Anthropic client for an API key."""
+    return AnthropicClient(api_key=api_key)
+
+
 def get_ollama_model(
     model_id: str | None = None,
     temperature: float = 0.1,
@@ -31,6 +52,7 @@ def get_ollama_model(
             "num_predict": 4096,  # Max tokens to generate
         },
         timeout=300.0,  # 5 minute timeout for long operations
+        client=_ollama_client(settings.ollama_base_url, 300.0),
     )
 
 
@@ -51,12 +73,15 @@ def get_anthropic_model(
         Configured Claude model instance
     """
     settings = get_settings()
+    # Without a key, leave client creation (and its error) to the first request
+    api_key = settings.anthropic_api_key or os.getenv("ANTHROPIC_API_KEY")
 
     return Claude(
         id=model_id or settings.anthropic_model,
         api_key=settings.anthropic_api_key,
         temperature=temperature if temperature is not None else settings.anthropic_temperature,
         max_tokens=max_tokens if max_tokens is not None else settings.anthropic_max_tokens,
+        client=_anthropic_client(api_key) if api_key else None,
     )
 
 
@@ -87,4 +112,5 @@ def get_embedding_model() -> Ollama:
     return Ollama(
         id=settings.ollama_embedding_model,
         host=settings.ollama_base_url,
+        client=_ollama_client(settings.ollama_base_url, None),
     )
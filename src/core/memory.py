@@ -7,15 +7,85 @@ Remember conversations, decisions, and code changes across sessions:
 - Context recall
 """
 
+import atexit
 import json
 import hashlib
+import heapq
+import mmap
+import queue
+import re
+import threading
+import time
+import uuid
+import weakref
+from collections import Counter, deque
+from functools import cached_property, lru_cache
+from itertools import islice
+from operator import itemgetter
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any
-from dataclasses import dataclass, asdict, field
+from typing import Optional, List, Dict, Any, Tuple
+from dataclasses import dataclass, field
 
 from src.config.settings import get_settings
 
+# Identifier-like words of 3+ characters, matched case-insensitively
+_KEYWORD_RE = re.compile(r'\b[a-zA-Z_][a-zA-Z0-9_]{2,}\b', re.IGNORECASE)
+
+# Common words left out of the index
+_STOPWORDS = frozenset({
+    'the', 'and', 'for', 'this', 'that', 'with', 'from', 'have', 'are', 'was', 'were', 'been',
+})
+
+# Keywords kept per text
+_MAX_KEYWORDS = 50
+
+# Memory files are read and written as bytes; use orjson when installed
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _JSON_READS_BUFFERS = True  # orjson parses memoryviews without copying
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    _json_loads = json.loads
+    _JSON_READS_BUFFERS = False
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+
+# Streaming parser for legacy entries.json arrays (optional)
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+    _LEGACY_LOAD_ERRORS = (ValueError, IOError, ijson.JSONError)
+except ImportError:
+    IJSON_AVAILABLE = False
+    _LEGACY_LOAD_ERRORS = (ValueError, IOError)
+
+
+def _read_json_file(path: Path) -> Any:
+    """Parse a JSON file, straight from a read-only memory map when possible."""
+    with open(path, 'rb') as f:
+        if not _JSON_READS_BUFFERS:
+            return _json_loads(f.read())
+        # mmap rejects empty files; parse those like any other invalid JSON
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                return _json_loads(view)
+            finally:
+                view.release()
+
+
+@lru_cache(maxsize=128)
+def _project_id_for(path_str: str) -> str:
+    """Short stable ID for a resolved project path."""
+    return hashlib.md5(path_str.encode()).hexdigest()[:12]
+
 
 @dataclass
 class MemoryEntry:
@@ -30,6 +100,20 @@ class MemoryEntry:
     file_path: Optional[str] = None
     importance: int = 1  # 1-5, higher = more important
 
+    def to_dict(self) -> Dict[str, Any]:
+        # Shallow, unlike asdict(): serialization needs no deep copy
+        return {
+            "id": self.id,
+            "timestamp": self.timestamp,
+            "type": self.type,
+            "content": self.content,
+            "context": self.context,
+            "tags": self.tags,
+            "project": self.project,
+            "file_path": self.file_path,
+            "importance": self.importance,
+        }
+
 
 @dataclass
 class ConversationSummary:
@@ -44,6 +128,23 @@ class ConversationSummary:
     errors_encountered: List[str]
     solutions_found: List[str]
 
+    def __post_init__(self):
+        # Membership index for files_modified; not a field, so to_dict skips it
+        self._files_modified_set = set(self.files_modified)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "session_id": self.session_id,
+            "started_at": self.started_at,
+            "ended_at": self.ended_at,
+            "message_count": self.message_count,
+            "topics": self.topics,
+            "files_modified": self.files_modified,
+            "key_decisions": self.key_decisions,
+            "errors_encountered": self.errors_encountered,
+            "solutions_found": self.solutions_found,
+        }
+
 
 class MemoryManager:
     """Manage persistent memory across sessions."""
@@ -62,107 +163,284 @@ class MemoryManager:
         self.project_memory_dir = self.memory_dir / self.project_id
         self.project_memory_dir.mkdir(parents=True, exist_ok=True)
 
-        # Memory files
-        self.entries_file = self.project_memory_dir / "entries.json"
+        # Memory files (entries are line-delimited JSON, appended per entry)
+        self.entries_file = self.project_memory_dir / "entries.jsonl"
+        self.legacy_entries_file = self.project_memory_dir / "entries.json"
         self.sessions_file = self.project_memory_dir / "sessions.json"
         self.index_file = self.project_memory_dir / "index.json"
 
-        # Load existing data
-        self.entries: List[MemoryEntry] = self._load_entries()
-        self.sessions: List[ConversationSummary] = self._load_sessions()
-        self.index: Dict[str, List[str]] = self._load_index()
+        # Memory limits
+        self.max_entries = 10000
+        self.max_entry_size = 50000  # characters
+        self.compact_slack = 1000  # appended entries allowed past max_entries
+
+        # Entries, sessions and the index load from disk on first access
+
+        # Index writes are coalesced; pending changes are flushed at exit
+        self.index_flush_interval = 2.0  # seconds
+        self._index_dirty = False
+        self._index_saved_at = time.monotonic()
+        # ID of the newest entry in the index, saved with it so entries
+        # appended after the last flush are re-indexed on the next load
+        self._indexed_through: Optional[str] = None
+
+        # New entries are indexed by a background thread, started on first use
+        self._index_lock = threading.RLock()
+        self._index_queue: "queue.Queue[Optional[Tuple[MemoryManager, MemoryEntry]]]" = queue.Queue()
+        self._index_thread: Optional[threading.Thread] = None
 
         # Current session
         self.current_session: Optional[ConversationSummary] = None
 
-        # Memory limits
-        self.max_entries = 10000
-        self.max_entry_size = 50000  # characters
+        _open_managers.add(self)
+
+    def __del__(self):
+        # Queued items hold a reference, so nothing is left to index here
+        if self.__dict__.get("_index_thread") is not None:
+            self._index_queue.put(None)  # Stop the worker
+            if self._index_dirty:
+                self._save_index()
+
+    @cached_property
+    def entries(self) -> List[MemoryEntry]:
+        """Memory entries, oldest first."""
+        return self._load_entries()
+
+    @cached_property
+    def sessions(self) -> List[ConversationSummary]:
+        """Summaries of finished sessions."""
+        return self._load_sessions()
+
+    @cached_property
+    def index(self) -> Dict[str, Dict[str, None]]:
+        """Search index: keyword -> ordered set of entry IDs.
+
+        Load it through _ensure_index() so sibling managers are flushed first.
+        """
+        return self._load_index()
+
+    # Derived from self.entries; _types and _file_paths stay aligned with it
+    # so filter scans compare plain strings instead of reading entry attributes
+
+    @cached_property
+    def _entry_by_id(self) -> Dict[str, MemoryEntry]:
+        return {e.id: e for e in self.entries}
+
+    @cached_property
+    def _types(self) -> List[str]:
+        return [e.type for e in self.entries]
+
+    @cached_property
+    def _file_paths(self) -> List[Optional[str]]:
+        return [e.file_path for e in self.entries]
 
     def _get_project_id(self) -> str:
         """Get unique ID for current project."""
-        path_str = str(self.project_path.resolve())
-        return hashlib.md5(path_str.encode()).hexdigest()[:12]
+        return _project_id_for(str(self.project_path.resolve()))
 
     def _load_entries(self) -> List[MemoryEntry]:
         """Load memory entries from disk."""
+        if not self.entries_file.exists() and self.legacy_entries_file.exists():
+            return self._migrate_legacy_entries()
+
+        entries = []
         if self.entries_file.exists():
             try:
-                with open(self.entries_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return [MemoryEntry(**e) for e in data]
-            except (json.JSONDecodeError, IOError):
+                with open(self.entries_file, 'rb') as f:
+                    for line in f:
+                        try:
+                            entries.append(MemoryEntry(**_json_loads(line)))
+                        except (ValueError, TypeError):
+                            continue  # Skip blank or partially written lines
+            except IOError:
                 pass
-        return []
+        return entries[-self.max_entries:]
+
+    def _migrate_legacy_entries(self) -> List[MemoryEntry]:
+        """Convert an old entries.json array into entries.jsonl.
+
+        With ijson the array is streamed, so only the newest max_entries
+        entries are held and no list of parsed dicts is built.
+        """
+        try:
+            if IJSON_AVAILABLE:
+                with open(self.legacy_entries_file, 'rb') as f:
+                    items = ijson.items(f, 'item', use_float=True)
+                    entries = list(deque((MemoryEntry(**e) for e in items), maxlen=self.max_entries))
+            else:
+                entries = [MemoryEntry(**e) for e in _read_json_file(self.legacy_entries_file)]
+        except _LEGACY_LOAD_ERRORS:
+            return []
+        self.entries = entries[-self.max_entries:]
+        self._save_entries()
+        return self.entries
 
     def _load_sessions(self) -> List[ConversationSummary]:
         """Load session summaries."""
         if self.sessions_file.exists():
             try:
-                with open(self.sessions_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return [ConversationSummary(**s) for s in data]
-            except (json.JSONDecodeError, IOError):
+                data = _read_json_file(self.sessions_file)
+                return [ConversationSummary(**s) for s in data]
+            except (ValueError, IOError):
                 pass
         return []
 
-    def _load_index(self) -> Dict[str, List[str]]:
-        """Load search index."""
+    def _load_index(self) -> Dict[str, Dict[str, None]]:
+        """Load search index (keyword -> ordered set of entry IDs).
+
+        Entries are appended to disk at once but the index is saved later,
+        so entries past the saved index's mark are indexed again here. An
+        index without a mark (older format) is rebuilt from all entries.
+        """
+        index: Dict[str, Dict[str, None]] = {}
+        indexed_through = None
         if self.index_file.exists():
             try:
-                with open(self.index_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
+                data = _read_json_file(self.index_file)
+                if isinstance(data.get("keywords"), dict):
+                    indexed_through = data.get("indexed_through")
+                    index = {keyword: dict.fromkeys(ids) for keyword, ids in data["keywords"].items()}
+            except (ValueError, IOError, AttributeError):
                 pass
-        return {}
+
+        entries = self.entries
+        start = 0
+        if indexed_through is not None:
+            for i in range(len(entries) - 1, -1, -1):
+                if entries[i].id == indexed_through:
+                    start = i + 1
+                    break
+        self._indexed_through = indexed_through
+        for entry in entries[start:]:
+            self._index_entry(index, entry)
+            self._index_dirty = True
+        return index
+
+    def _reindex_entries(self):
+        """Drop the ID map and columns so they are rebuilt from self.entries."""
+        for name in ("_entry_by_id", "_types", "_file_paths"):
+            self.__dict__.pop(name, None)
+
+    def _append_entry(self, entry: MemoryEntry):
+        """Append one entry to disk without rewriting the others."""
+        try:
+            with open(self.entries_file, 'ab') as f:
+                f.write(_json_dumps(entry.to_dict()) + b"\n")
+        except IOError:
+            pass
 
     def _save_entries(self):
-        """Save entries to disk."""
+        """Rewrite (compact) the entries file, keeping the newest max_entries."""
+        self.entries = self.entries[-self.max_entries:]
+        tmp_file = self.entries_file.with_suffix(".jsonl.tmp")
         try:
-            with open(self.entries_file, 'w', encoding='utf-8') as f:
-                json.dump([asdict(e) for e in self.entries[-self.max_entries:]], f, indent=2)
+            with open(tmp_file, 'wb') as f:
+                f.writelines(_json_dumps(e.to_dict()) + b"\n" for e in self.entries)
+            tmp_file.replace(self.entries_file)
         except IOError:
             pass
 
     def _save_sessions(self):
         """Save sessions to disk."""
         try:
-            with open(self.sessions_file, 'w', encoding='utf-8') as f:
-                json.dump([asdict(s) for s in self.sessions], f, indent=2)
+            with open(self.sessions_file, 'wb') as f:
+                f.write(_json_dumps([s.to_dict() for s in self.sessions]))
         except IOError:
             pass
 
+    def _maybe_save_index(self, force: bool = False):
+        """Save the index if it changed and the flush interval has passed."""
+        if not self._index_dirty:
+            return
+        if force or time.monotonic() - self._index_saved_at >= self.index_flush_interval:
+            self._save_index()
+
+    def flush(self):
+        """Write any pending index changes to disk."""
+        self._wait_for_index()
+        with self._index_lock:
+            self._maybe_save_index(force=True)
+
+    def _ensure_index(self):
+        """Load the index in the calling thread if it is not loaded yet.
+
+        Another manager for this project may hold index changes not yet
+        saved, so those are flushed first. This happens before taking our
+        lock and never on an indexer thread, so two managers loading at
+        once cannot wait on each other.
+        """
+        if "index" in self.__dict__:
+            return
+        for manager in list(_open_managers):
+            if manager is not self and manager.index_file == self.index_file:
+                manager.flush()
+        with self._index_lock:
+            if "index" not in self.__dict__:
+                self.index = self._load_index()
+
+    def _queue_for_index(self, entry: MemoryEntry):
+        """Hand an entry to the background indexer."""
+        self._ensure_index()
+        if self._index_thread is None:
+            self._index_thread = threading.Thread(
+                target=_index_worker,
+                args=(self._index_queue,),
+                name="memory-indexer",
+                daemon=True,
+            )
+            self._index_thread.start()
+        self._index_queue.put((self, entry))
+
+    def _wait_for_index(self):
+        """Block until queued entries are in the index."""
+        if self._index_thread is not None:
+            self._index_queue.join()
+
     def _save_index(self):
         """Save index to disk."""
+        self._index_dirty = False
+        self._index_saved_at = time.monotonic()
         try:
-            with open(self.index_file, 'w', encoding='utf-8') as f:
-                json.dump(self.index, f, indent=2)
+            with open(self.index_file, 'wb') as f:
+                f.write(_json_dumps({
+                    "indexed_through": self._indexed_through,
+                    "keywords": {keyword: list(ids) for keyword, ids in self.index.items()},
+                }))
         except IOError:
             pass
 
     def _generate_id(self) -> str:
         """Generate unique entry ID."""
-        return f"mem_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+        return f"mem_{uuid.uuid4().hex[:16]}"
 
     def _extract_keywords(self, text: str) -> List[str]:
-        """Extract keywords from text for indexing."""
-        import re
-        # Simple keyword extraction
-        words = re.findall(r'\b[a-zA-Z_][a-zA-Z0-9_]{2,}\b', text.lower())
-        # Filter common words
-        stopwords = {'the', 'and', 'for', 'this', 'that', 'with', 'from', 'have', 'are', 'was', 'were', 'been'}
-        return list(set(w for w in words if w not in stopwords))[:50]
+        """Extract keywords from text for indexing.
+
+        Keeps the first distinct words in order and stops scanning once
+        enough are found, so long entries are not matched to the end.
+        """
+        keywords: Dict[str, None] = {}
+        for match in _KEYWORD_RE.finditer(text):
+            word = match.group().lower()
+            if word not in _STOPWORDS:
+                keywords[word] = None
+                if len(keywords) >= _MAX_KEYWORDS:
+                    break
+        return list(keywords)
 
     def _update_index(self, entry: MemoryEntry):
         """Update search index with entry."""
+        self._index_entry(self.index, entry)
+
+    def _index_entry(self, index: Dict[str, Dict[str, None]], entry: MemoryEntry):
+        """Add an entry's keywords and tags to index and advance the mark."""
         keywords = self._extract_keywords(entry.content)
         keywords.extend(entry.tags)
 
+        # Dicts act as insertion-ordered sets: O(1) adds, stable recall order
         for keyword in keywords:
-            if keyword not in self.index:
-                self.index[keyword] = []
-            if entry.id not in self.index[keyword]:
-                self.index[keyword].append(entry.id)
+            index.setdefault(keyword, {})[entry.id] = None
+        self._indexed_through = entry.id
 
     def start_session(self, session_id: str):
         """Start a new conversation session."""
@@ -209,13 +487,16 @@ class MemoryManager:
         Returns:
             Created memory entry
         """
+        # Load (and reconcile) the index before this entry is on disk
+        self._ensure_index()
+
         # Truncate if too long
         if len(content) > self.max_entry_size:
             content = content[:self.max_entry_size] + "...[truncated]"
 
         entry = MemoryEntry(
             id=self._generate_id(),
-            timestamp=datetime.now().isoformat(),
+            timestamp=datetime.now().isoformat(timespec='seconds'),
             type=entry_type,
             content=content,
             context=context or {},
@@ -225,10 +506,17 @@ class MemoryManager:
             importance=importance,
         )
 
+        # Build the derived views before the list grows so the entry is added once
+        entry_by_id, types, file_paths = self._entry_by_id, self._types, self._file_paths
         self.entries.append(entry)
-        self._update_index(entry)
-        self._save_entries()
-        self._save_index()
+        entry_by_id[entry.id] = entry
+        types.append(entry.type)
+        file_paths.append(entry.file_path)
+        self._append_entry(entry)
+        if len(self.entries) > self.max_entries + self.compact_slack:
+            self._save_entries()
+            self._reindex_entries()
+        self._queue_for_index(entry)
 
         # Update session if active
         if self.current_session:
@@ -239,8 +527,10 @@ class MemoryManager:
                 self.current_session.solutions_found.append(content[:100])
             elif entry_type == "decision":
                 self.current_session.key_decisions.append(content[:100])
-            if file_path and file_path not in self.current_session.files_modified:
-                self.current_session.files_modified.append(file_path)
+            session = self.current_session
+            if file_path and file_path not in session._files_modified_set:
+                session._files_modified_set.add(file_path)
+                session.files_modified.append(file_path)
 
         return entry
 
@@ -265,46 +555,44 @@ class MemoryManager:
         """
         keywords = self._extract_keywords(query)
 
-        # Find matching entry IDs
-        matching_ids: Dict[str, int] = {}
-        for keyword in keywords:
-            if keyword in self.index:
-                for entry_id in self.index[keyword]:
-                    matching_ids[entry_id] = matching_ids.get(entry_id, 0) + 1
-
-        # Sort by match count
-        sorted_ids = sorted(matching_ids.keys(), key=lambda x: -matching_ids[x])
-
-        # Get entries
-        results = []
-        id_to_entry = {e.id: e for e in self.entries}
-
-        for entry_id in sorted_ids:
-            if entry_id in id_to_entry:
-                entry = id_to_entry[entry_id]
-
-                # Apply filters
-                if entry_type and entry.type != entry_type:
-                    continue
-                if entry.importance < min_importance:
-                    continue
-
-                results.append(entry)
-                if len(results) >= limit:
-                    break
-
-        return results
+        # Count keyword matches per entry ID
+        self._wait_for_index()
+        self._ensure_index()
+        match_counts: Counter = Counter()
+        with self._index_lock:
+            for keyword in keywords:
+                match_counts.update(self.index.get(keyword, {}).keys())
+
+        # Resolve and filter matches; the index may hold IDs of removed entries
+        candidates = []
+        for entry_id, count in match_counts.items():
+            entry = self._entry_by_id.get(entry_id)
+            if entry is None:
+                continue
+            if entry_type and entry.type != entry_type:
+                continue
+            if entry.importance < min_importance:
+                continue
+            candidates.append((count, entry))
+
+        # Best matches first; ties keep index order
+        return [entry for _, entry in heapq.nlargest(limit, candidates, key=itemgetter(0))]
 
     def recall_recent(self, limit: int = 20, entry_type: Optional[str] = None) -> List[MemoryEntry]:
         """Get most recent memories."""
-        entries = self.entries
-        if entry_type:
-            entries = [e for e in entries if e.type == entry_type]
-        return list(reversed(entries[-limit:]))
+        if not entry_type:
+            return list(reversed(self.entries[-limit:]))
+        # Scan newest first and stop once enough entries match
+        matches = (e for t, e in zip(reversed(self._types), reversed(self.entries)) if t == entry_type)
+        return list(islice(matches, limit))
 
     def recall_by_file(self, file_path: str, limit: int = 20) -> List[MemoryEntry]:
         """Get memories related to a specific file."""
-        return [e for e in reversed(self.entries) if e.file_path == file_path][:limit]
+        matches = (
+            e for path, e in zip(reversed(self._file_paths), reversed(self.entries))
+            if path == file_path
+        )
+        return list(islice(matches, limit))
 
     def recall_errors(self, limit: int = 10) -> List[MemoryEntry]:
         """Get recent errors."""
@@ -365,9 +653,9 @@ class MemoryManager:
 
     def get_project_summary(self) -> Dict[str, Any]:
         """Get summary of project memory."""
-        type_counts = {}
-        for entry in self.entries:
-            type_counts[entry.type] = type_counts.get(entry.type, 0) + 1
+        type_counts = dict(Counter(self._types))
+        self._wait_for_index()
+        self._ensure_index()
 
         return {
             "project": str(self.project_path.name),
@@ -381,33 +669,84 @@ class MemoryManager:
 
     def forget(self, entry_id: str) -> bool:
         """Remove a specific memory entry."""
-        for i, entry in enumerate(self.entries):
-            if entry.id == entry_id:
-                self.entries.pop(i)
-                self._save_entries()
-                return True
-        return False
+        entry = self._entry_by_id.get(entry_id)
+        if entry is None:
+            return False
+        self.entries.remove(entry)
+        self._save_entries()
+        self._reindex_entries()
+        return True
 
     def clear_all(self):
         """Clear all memory for this project."""
+        self._wait_for_index()
         self.entries = []
+        self._reindex_entries()
         self.sessions = []
-        self.index = {}
+        with self._index_lock:
+            self.index = {}
+            self._indexed_through = None
+            self._save_index()
         self._save_entries()
         self._save_sessions()
-        self._save_index()
+
+
+def _index_worker(pending: "queue.Queue[Optional[Tuple[MemoryManager, MemoryEntry]]]"):
+    """Index queued (manager, entry) pairs until None is queued.
+
+    Entries still queued at a hard exit are already in entries.jsonl;
+    _load_index indexes them on the next load.
+    """
+    while True:
+        item = pending.get()
+        try:
+            if item is None:
+                return
+            manager, entry = item
+            with manager._index_lock:
+                manager._update_index(entry)
+                manager._index_dirty = True
+                manager._maybe_save_index()
+        except Exception:
+            pass  # Keep the worker alive; waiters rely on task_done
+        finally:
+            item = manager = None  # Let the manager be collected while idle
+            pending.task_done()
+
+
+# Managers that may hold unsaved index changes, flushed at exit
+_open_managers: "weakref.WeakSet[MemoryManager]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_managers():
+    for manager in list(_open_managers):
+        manager.flush()
 
 
 # Global instance
 _memory_manager: Optional[MemoryManager] = None
 
+# One manager per resolved project path
+_managers: Dict[str, MemoryManager] = {}
+
 
 def get_memory_manager(project_path: Optional[Path] = None) -> MemoryManager:
-    """Get or create memory manager."""
+    """Get or create memory manager.
+
+    Passing a project path makes its (shared) manager the default.
+    """
     global _memory_manager
-    if _memory_manager is None or project_path:
-        _memory_manager = MemoryManager(project_path)
-    return _memory_manager
+    if _memory_manager is not None and not project_path:
+        return _memory_manager
+
+    path = Path(project_path) if project_path else Path.cwd()
+    key = str(path.resolve())
+    manager = _managers.get(key)
+    if manager is None:
+        manager = _managers[key] = MemoryManager(path)
+    _memory_manager = manager
+    return manager
 
 
 # Convenience functions
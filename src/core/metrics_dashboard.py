@@ -7,17 +7,93 @@ Comprehensive code metrics:
 - Technical debt indicators
 """
 
+import json
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
 from pathlib import Path
 from typing import Optional, List, Dict, Any
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
-from collections import defaultdict
+from collections import Counter, defaultdict
 
 from src.config.settings import get_settings
 
+# The metrics cache is read and written as bytes; use orjson when installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps  # Serializes dataclasses natively
+except ImportError:
+    _json_loads = json.loads
 
-@dataclass
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, default=asdict).encode('utf-8')
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+
+# Structure patterns
+_PY_STRUCT_RE = re.compile(r'^[\s]*(?:(?P<func>(?:async\s+)?def)|(?P<cls>class))\s+\w+', re.MULTILINE)
+_JS_FUNC_RE = re.compile(r'(?:function\s+\w+|(?:const|let|var)\s+\w+\s*=\s*(?:async\s+)?(?:\([^)]*\)|[^=])\s*=>)')
+_JS_CLASS_RE = re.compile(r'\bclass\s+\w+')
+_C_FUNC_RE = re.compile(r'\bfunc\s+\w+|\b\w+\s+\w+\s*\([^)]*\)\s*\{')
+_C_TYPE_RE = re.compile(r'\b(?:class|struct|type)\s+\w+')
+_TODO_RE = re.compile(r'\b(?:TODO|FIXME|HACK|XXX)\b', re.IGNORECASE)
+
+# Whitespace-only line, including its newline
+_BLANK_LINE_RE = re.compile(r'^[^\S\n]*\n', re.MULTILINE)
+
+# Decision point patterns. "else if" sits with the operators because it is
+# counted on top of its own "if".
+_PY_DECISION_PATTERN = r'\b(?:if|elif|for|while|and|or|except|with)\b'
+_C_STYLE_DECISION_PATTERN = r'\b(?:if|for|while|switch|case|catch)\b'
+_PY_DECISION_RE = re.compile(_PY_DECISION_PATTERN)
+_C_STYLE_DECISION_RE = re.compile(_C_STYLE_DECISION_PATTERN)
+_C_STYLE_OPERATOR_RE = re.compile(r'&&|\|\||\belse\s+if\b')
+_JS_OPERATOR_RE = re.compile(r'&&|\|\||\?(?![?.])|\belse\s+if\b')
+
+# Bump when FileMetrics' layout or how it is computed changes, so stale
+# cached metrics are discarded
+_METRICS_CACHE_VERSION = 3
+
+
+def _compile_hyperscan(pattern: str):
+    """Compile a block-mode Hyperscan database for a single pattern."""
+    database = hyperscan.Database()
+    database.compile(expressions=[pattern.encode()], ids=[0], elements=1)
+    return database
+
+
+# The keyword scans run on Hyperscan when it is installed. Its \b is ASCII
+# only, so it is used for ASCII text, where it agrees with re. Keyword
+# matches never overlap, so one callback per match is the findall count.
+_PY_DECISION_DB = _compile_hyperscan(_PY_DECISION_PATTERN) if HYPERSCAN_AVAILABLE else None
+_C_STYLE_DECISION_DB = _compile_hyperscan(_C_STYLE_DECISION_PATTERN) if HYPERSCAN_AVAILABLE else None
+
+
+def _count_decisions(pattern: re.Pattern, database, content: str) -> int:
+    """Count decision keyword matches in content."""
+    if database is None or not content.isascii():
+        return len(pattern.findall(content))
+
+    matches = 0
+
+    def on_match(*_):
+        nonlocal matches
+        matches += 1
+
+    database.scan(content.encode('ascii'), match_event_handler=on_match)
+    return matches
+
+
+@dataclass(slots=True)
 class FileMetrics:
     """Metrics for a single file."""
     path: str
@@ -87,28 +163,47 @@ class MetricsDashboard:
         '.md': 'Markdown',
     }
 
-    # Comment patterns by language
-    COMMENT_PATTERNS = {
-        'Python': (r'#.*$', r'"""[\s\S]*?"""', r"'''[\s\S]*?'''"),
-        'JavaScript': (r'//.*$', r'/\*[\s\S]*?\*/'),
-        'TypeScript': (r'//.*$', r'/\*[\s\S]*?\*/'),
-        'Rust': (r'//.*$', r'/\*[\s\S]*?\*/'),
-        'Go': (r'//.*$', r'/\*[\s\S]*?\*/'),
-        'Java': (r'//.*$', r'/\*[\s\S]*?\*/'),
-        'C#': (r'//.*$', r'/\*[\s\S]*?\*/'),
-        'C++': (r'//.*$', r'/\*[\s\S]*?\*/'),
-        'C': (r'//.*$', r'/\*[\s\S]*?\*/'),
-        'Ruby': (r'#.*$', r'=begin[\s\S]*?=end'),
-        'Shell': (r'#.*$',),
-        'SQL': (r'--.*$', r'/\*[\s\S]*?\*/'),
-        'HTML': (r'<!--[\s\S]*?-->',),
-        'CSS': (r'/\*[\s\S]*?\*/',),
+    # Directories skipped during analysis (as well as any hidden directory)
+    IGNORED_DIRS = frozenset({'node_modules', '__pycache__', 'venv', 'dist', 'build'})
+
+    # Comment line prefixes by language, matched after a line's indentation
+    COMMENT_PREFIXES = {
+        'Python': ('#', '"""', "'''"),
+        'JavaScript': ('//', '/*', '*'),
+        'TypeScript': ('//', '/*', '*'),
+        'Rust': ('//', '/*', '*'),
+        'Go': ('//', '/*', '*'),
+        'Java': ('//', '/*', '*'),
+        'C#': ('//', '/*', '*'),
+        'C++': ('//', '/*', '*'),
+        'C': ('//', '/*', '*'),
+        'Ruby': ('#', '=begin'),
+        'Shell': ('#',),
+        'SQL': ('--', '/*'),
+        'HTML': ('<!--',),
+        'CSS': ('/*',),
     }
 
-    def __init__(self, working_dir: Optional[Path] = None):
-        """Initialize dashboard."""
+    _COMMENT_LINE_RE = {
+        lang: re.compile(rf'^[^\S\n]*(?:{"|".join(map(re.escape, prefixes))})', re.MULTILINE)
+        for lang, prefixes in COMMENT_PREFIXES.items()
+    }
+
+    # Below this many files, starting worker processes costs more than it saves
+    PARALLEL_MIN_FILES = 200
+
+    # Per-file metrics cache, kept in the working directory
+    CACHE_FILE = '.metrics_cache.json'
+
+    def __init__(self, working_dir: Optional[Path] = None, cache: bool = True):
+        """Initialize dashboard.
+
+        File metrics are cached by (path, mtime, size) so unchanged files
+        are not re-analyzed, unless ``cache`` is False.
+        """
         self.working_dir = working_dir or Path.cwd()
         self.metrics: Optional[ProjectMetrics] = None
+        self._cache_path: Optional[Path] = self.working_dir / self.CACHE_FILE if cache else None
 
     def analyze(self) -> ProjectMetrics:
         """
@@ -123,18 +218,22 @@ class MetricsDashboard:
         )
 
         # Find all code files
-        for ext in self.LANGUAGES:
-            for file_path in self.working_dir.rglob(f'*{ext}'):
-                # Skip ignored directories
-                parts = file_path.parts
-                if any(p.startswith('.') or p in ('node_modules', '__pycache__', 'venv', '.venv', 'dist', 'build')
-                       for p in parts):
+        paths = []
+        for root, dirs, filenames in os.walk(self.working_dir):
+            # Prune ignored directories so they are never descended into
+            dirs[:] = [d for d in dirs if not d.startswith('.') and d not in self.IGNORED_DIRS]
+
+            for filename in filenames:
+                if filename.startswith('.'):
                     continue
+                if os.path.splitext(filename)[1].lower() in self.LANGUAGES:
+                    paths.append(Path(root) / filename)
 
-                file_metrics = self._analyze_file(file_path)
-                if file_metrics:
-                    self.metrics.files.append(file_metrics)
-                    self._aggregate_metrics(file_metrics)
+        results = self._analyze_cached(paths) if self._cache_path else self._analyze_files(paths)
+        for file_metrics in results:
+            if file_metrics:
+                self.metrics.files.append(file_metrics)
+                self._aggregate_metrics(file_metrics)
 
         # Calculate averages
         if self.metrics.files:
@@ -150,13 +249,86 @@ class MetricsDashboard:
 
         return self.metrics
 
+    def _analyze_cached(self, paths: List[Path]) -> List[Optional[FileMetrics]]:
+        """Analyze files, reusing cached metrics for unchanged ones."""
+        cached = self._load_cache()
+        results: List[Optional[FileMetrics]] = [None] * len(paths)
+        keys: List[Optional[str]] = [None] * len(paths)
+        missing: List[int] = []
+
+        for i, path in enumerate(paths):
+            try:
+                st = path.stat()
+            except OSError:
+                continue  # Removed since the walk
+            keys[i] = key = f'{path}:{st.st_mtime_ns}:{st.st_size}'
+            entry = cached.get(key)
+            if entry is not None:
+                try:
+                    results[i] = FileMetrics(**entry)
+                    continue
+                except TypeError:
+                    pass
+            missing.append(i)
+
+        analyzed = self._analyze_files([paths[i] for i in missing])
+        for i, file_metrics in zip(missing, analyzed):
+            results[i] = file_metrics
+
+        files = {key: fm for key, fm in zip(keys, results) if key and fm}
+        if missing or len(files) != len(cached):
+            self._save_cache(files)
+        return results
+
+    def _load_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Load cached file metrics, or an empty dict if missing or stale."""
+        try:
+            data = _json_loads(self._cache_path.read_bytes())
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get('version') != _METRICS_CACHE_VERSION:
+            return {}
+        files = data.get('files')
+        return files if isinstance(files, dict) else {}
+
+    def _save_cache(self, files: Dict[str, FileMetrics]):
+        """Write the metrics cache; failures only cost a re-analysis."""
+        tmp = self._cache_path.with_suffix(f'.{os.getpid()}.tmp')
+        try:
+            with open(tmp, 'wb') as f:
+                f.write(_json_dumps({'version': _METRICS_CACHE_VERSION, 'files': files}))
+            os.replace(tmp, self._cache_path)
+        except OSError:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+
+    def _analyze_files(self, paths: List[Path]) -> List[Optional[FileMetrics]]:
+        """Analyze files, spreading large trees across worker processes."""
+        if len(paths) >= self.PARALLEL_MIN_FILES:
+            try:
+                with ProcessPoolExecutor() as executor:
+                    return list(executor.map(
+                        _analyze_file_worker, paths, repeat(self.working_dir),
+                        chunksize=16,
+                    ))
+            except (OSError, BrokenProcessPool):
+                pass  # No worker processes available; analyze in-process
+
+        return [self._analyze_file(path) for path in paths]
+
     def _analyze_file(self, file_path: Path) -> Optional[FileMetrics]:
         """Analyze a single file."""
         try:
-            content = file_path.read_text(encoding='utf-8')
+            content = file_path.read_bytes().decode('utf-8')
         except (IOError, UnicodeDecodeError):
             return None
 
+        # Same newline handling as read_text()
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+
         language = self.LANGUAGES.get(file_path.suffix.lower(), 'Unknown')
 
         try:
@@ -169,105 +341,53 @@ class MetricsDashboard:
             language=language,
         )
 
-        lines = content.splitlines()
-        metrics.lines_total = len(lines)
-
-        # Count line types
-        in_multiline_comment = False
-        for line in lines:
-            stripped = line.strip()
-
-            if not stripped:
-                metrics.lines_blank += 1
-            elif self._is_comment_line(stripped, language, in_multiline_comment):
-                metrics.lines_comments += 1
-            else:
-                metrics.lines_code += 1
+        # Count line types with whole-file scans rather than a per-line loop.
+        # Lines end at '\n' only: unlike str.splitlines(), form feeds,
+        # vertical tabs and other separators do not start a new line.
+        last_line = content[content.rfind('\n') + 1:]
+        metrics.lines_total = content.count('\n') + (1 if last_line else 0)
+        metrics.lines_blank = len(_BLANK_LINE_RE.findall(content))
+        if last_line and last_line.isspace():
+            metrics.lines_blank += 1  # Unterminated blank last line
+        comment_re = self._COMMENT_LINE_RE.get(language)
+        if comment_re:
+            metrics.lines_comments = len(comment_re.findall(content))
+        metrics.lines_code = metrics.lines_total - metrics.lines_blank - metrics.lines_comments
 
         # Count structures and complexity
         if language == 'Python':
-            metrics.functions = len(re.findall(r'^[\s]*(?:async\s+)?def\s+\w+', content, re.MULTILINE))
-            metrics.classes = len(re.findall(r'^[\s]*class\s+\w+', content, re.MULTILINE))
+            structures = Counter(m.lastgroup for m in _PY_STRUCT_RE.finditer(content))
+            metrics.functions = structures['func']
+            metrics.classes = structures['cls']
             metrics.complexity = self._calculate_python_complexity(content)
         elif language in ('JavaScript', 'TypeScript'):
-            metrics.functions = len(re.findall(r'(?:function\s+\w+|(?:const|let|var)\s+\w+\s*=\s*(?:async\s+)?(?:\([^)]*\)|[^=])\s*=>)', content))
-            metrics.classes = len(re.findall(r'\bclass\s+\w+', content))
+            metrics.functions = len(_JS_FUNC_RE.findall(content))
+            metrics.classes = len(_JS_CLASS_RE.findall(content))
             metrics.complexity = self._calculate_js_complexity(content)
         elif language in ('Go', 'Rust', 'Java', 'C#', 'C++', 'C'):
-            metrics.functions = len(re.findall(r'\bfunc\s+\w+|\b\w+\s+\w+\s*\([^)]*\)\s*\{', content))
-            metrics.classes = len(re.findall(r'\b(?:class|struct|type)\s+\w+', content))
+            metrics.functions = len(_C_FUNC_RE.findall(content))
+            metrics.classes = len(_C_TYPE_RE.findall(content))
             metrics.complexity = self._calculate_c_style_complexity(content)
 
         # Count TODOs
-        metrics.todos = len(re.findall(r'\b(?:TODO|FIXME|HACK|XXX)\b', content, re.IGNORECASE))
+        metrics.todos = len(_TODO_RE.findall(content))
 
         return metrics
 
-    def _is_comment_line(self, line: str, language: str, in_multiline: bool) -> bool:
-        """Check if a line is a comment."""
-        patterns = self.COMMENT_PATTERNS.get(language, ())
-
-        for pattern in patterns:
-            if re.match(pattern, line):
-                return True
-
-        # Simple heuristics
-        if language == 'Python' and (line.startswith('#') or line.startswith('"""') or line.startswith("'''")):
-            return True
-        if language in ('JavaScript', 'TypeScript', 'Go', 'Rust', 'Java', 'C#', 'C++', 'C'):
-            if line.startswith('//') or line.startswith('/*') or line.startswith('*'):
-                return True
-
-        return False
-
     def _calculate_python_complexity(self, content: str) -> int:
         """Calculate cyclomatic complexity for Python."""
-        complexity = 1  # Base complexity
-
-        # Decision points
-        complexity += len(re.findall(r'\bif\b', content))
-        complexity += len(re.findall(r'\belif\b', content))
-        complexity += len(re.findall(r'\bfor\b', content))
-        complexity += len(re.findall(r'\bwhile\b', content))
-        complexity += len(re.findall(r'\band\b', content))
-        complexity += len(re.findall(r'\bor\b', content))
-        complexity += len(re.findall(r'\bexcept\b', content))
-        complexity += len(re.findall(r'\bwith\b', content))
-
-        return complexity
+        # Base complexity plus one per decision point
+        return 1 + _count_decisions(_PY_DECISION_RE, _PY_DECISION_DB, content)
 
     def _calculate_js_complexity(self, content: str) -> int:
         """Calculate cyclomatic complexity for JavaScript/TypeScript."""
-        complexity = 1
-
-        complexity += len(re.findall(r'\bif\b', content))
-        complexity += len(re.findall(r'\belse\s+if\b', content))
-        complexity += len(re.findall(r'\bfor\b', content))
-        complexity += len(re.findall(r'\bwhile\b', content))
-        complexity += len(re.findall(r'\bswitch\b', content))
-        complexity += len(re.findall(r'\bcase\b', content))
-        complexity += len(re.findall(r'&&', content))
-        complexity += len(re.findall(r'\|\|', content))
-        complexity += len(re.findall(r'\bcatch\b', content))
-        complexity += len(re.findall(r'\?(?![?.])', content))  # Ternary
-
-        return complexity
+        return (1 + _count_decisions(_C_STYLE_DECISION_RE, _C_STYLE_DECISION_DB, content)
+                + len(_JS_OPERATOR_RE.findall(content)))
 
     def _calculate_c_style_complexity(self, content: str) -> int:
         """Calculate complexity for C-style languages."""
-        complexity = 1
-
-        complexity += len(re.findall(r'\bif\b', content))
-        complexity += len(re.findall(r'\belse\s+if\b', content))
-        complexity += len(re.findall(r'\bfor\b', content))
-        complexity += len(re.findall(r'\bwhile\b', content))
-        complexity += len(re.findall(r'\bswitch\b', content))
-        complexity += len(re.findall(r'\bcase\b', content))
-        complexity += len(re.findall(r'&&', content))
-        complexity += len(re.findall(r'\|\|', content))
-        complexity += len(re.findall(r'\bcatch\b', content))
-
-        return complexity
+        return (1 + _count_decisions(_C_STYLE_DECISION_RE, _C_STYLE_DECISION_DB, content)
+                + len(_C_STYLE_OPERATOR_RE.findall(content)))
 
     def _aggregate_metrics(self, file_metrics: FileMetrics):
         """Aggregate file metrics into project metrics."""
@@ -427,6 +547,11 @@ class MetricsDashboard:
         }
 
 
+def _analyze_file_worker(file_path: Path, working_dir: Path) -> Optional[FileMetrics]:
+    """Analyze one file in a worker process."""
+    return MetricsDashboard(working_dir)._analyze_file(file_path)
+
+
 # Global dashboard
 _metrics_dashboard: Optional[MetricsDashboard] = None
 
@@ -0,0 +1,273 @@
+"""Tests for cached state in core modules."""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import textwrap
+import types
+from pathlib import Path
+
+import pytest
+
+from src.core import dependency_analyzer, memory
+from src.core.dependency_analyzer import DependencyAnalyzer
+from src.core.git_integration import GitIntegration, git_status
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _bump_mtime(path: Path):
+    """Move a file's mtime forward so mtime-keyed caches see the change."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+class TestGitIntegration:
+    """Tests for git status freshness and repository side effects."""
+
+    @pytest.fixture
+    def repo(self, tmp_path):
+        def git(*args):
+            subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+
+        git("init", "-q")
+        git("config", "user.email", "test@example.com")
+        git("config", "user.name", "Test")
+        (tmp_path / "app.py").write_text("x = 1\n")
+        git("add", ".")
+        git("commit", "-qm", "init")
+        git("branch", "feature")
+        return tmp_path
+
+    def test_status_reflects_edit(self, repo):
+        """A tracked-file edit shows up without any explicit invalidation."""
+        assert git_status(repo).is_clean
+
+        (repo / "app.py").write_text("x = 2\n")
+        status = git_status(repo)
+        assert not status.is_clean
+        assert "app.py" in status.modified
+
+    def test_status_report_snapshot(self, repo):
+        """The report combines fresh status with the branch listing."""
+        integration = GitIntegration(repo)
+        (repo / "app.py").write_text("x = 2\n")
+
+        report = integration.get_status_report()
+        assert "Branches: 2 local, 0 remote" in report
+        assert "~ app.py" in report
+
+    def test_commit_graph_written_only_on_request(self, repo):
+        """Opening a repo leaves .git/objects/info alone."""
+        info_dir = repo / ".git" / "objects" / "info"
+        integration = GitIntegration(repo)
+        integration.get_log()
+        assert not (info_dir / "commit-graph").exists()
+
+        assert integration.write_commit_graph()
+        assert (info_dir / "commit-graph").exists()
+
+
+class TestDependencyAnalyzer:
+    """Tests for unused-import detection and its cache."""
+
+    def test_string_annotation_counts_as_use(self, tmp_path):
+        """Names used only in string annotations are not reported unused."""
+        (tmp_path / "mod.py").write_text(
+            "from typing import Optional\n"
+            "from pathlib import Path\n"
+            "import json\n"
+            "\n"
+            "def load(p: 'Optional[Path]') -> None:\n"
+            "    pass\n"
+        )
+
+        graph = DependencyAnalyzer(tmp_path).analyze()
+        assert graph.unused == {"mod.py": ["json"]}
+
+    def test_analyze_file_returns_per_file_state(self, tmp_path):
+        """Per-file analysis returns its counts instead of storing them."""
+        source = tmp_path / "mod.py"
+        source.write_text("import os  # noqa\nimport sys\n\nsys.exit()\n")
+
+        file_imports, name_counts, noqa_lines = DependencyAnalyzer._analyze_file(source)
+        assert [imp.module for imp in file_imports.imports] == ["os", "sys"]
+        assert file_imports.stdlib == ["os", "sys"]
+        assert name_counts["sys"] == 2
+        assert noqa_lines == {1}
+
+    def test_analyze_file_unparsable(self, tmp_path):
+        """A file with a syntax error yields no imports and no counts."""
+        source = tmp_path / "broken.py"
+        source.write_text("import os\ndef (:\n")
+
+        file_imports, name_counts, noqa_lines = DependencyAnalyzer._analyze_file(source)
+        assert file_imports.imports == []
+        assert name_counts is None
+        assert noqa_lines == set()
+
+    def test_cache_invalidated_on_mtime_change(self, tmp_path):
+        """Editing a file is picked up by the next analyze() call."""
+        source = tmp_path / "mod.py"
+        source.write_text("import os\n\nos.getcwd()\n")
+
+        graph = DependencyAnalyzer(tmp_path).analyze()
+        assert graph.unused == {}
+        # Unchanged tree: the cached graph is returned without copying
+        assert DependencyAnalyzer(tmp_path).analyze() is graph
+
+        source.write_text("import os\nimport sys\n\nos.getcwd()\n")
+        _bump_mtime(source)
+        assert DependencyAnalyzer(tmp_path).analyze().unused == {"mod.py": ["sys"]}
+
+
+    def test_cache_keeps_recent_directories(self, tmp_path):
+        """The analysis cache holds only the most recently used directories."""
+        dirs = []
+        for i in range(dependency_analyzer._ANALYSIS_CACHE_MAX + 1):
+            project = tmp_path / f"p{i}"
+            project.mkdir()
+            (project / "mod.py").write_text("import os\n")
+            dirs.append(project)
+
+        first = DependencyAnalyzer(dirs[0]).analyze()
+        for project in dirs[1:]:
+            DependencyAnalyzer(project).analyze()
+
+        cache = dependency_analyzer._analysis_cache
+        assert len(cache) <= dependency_analyzer._ANALYSIS_CACHE_MAX
+        assert str(dirs[0]) not in cache
+        assert DependencyAnalyzer(dirs[0]).analyze() is not first
+
+
+class TestMemoryMigration:
+    """Tests for migrating legacy memory files."""
+
+    @pytest.fixture
+    def manager_factory(self, tmp_path, monkeypatch):
+        settings = types.SimpleNamespace(data_dir=tmp_path / "data")
+        monkeypatch.setattr(memory, "get_settings", lambda: settings)
+        project = tmp_path / "project"
+        project.mkdir()
+        return lambda: memory.MemoryManager(project)
+
+    def test_legacy_entries_migrated(self, manager_factory):
+        """An old entries.json array is converted to entries.jsonl."""
+        manager = manager_factory()
+        legacy = [
+            {
+                "id": f"e{i}",
+                "timestamp": "2024-01-01T00:00:00",
+                "type": "error",
+                "content": f"entry {i}",
+                "context": {"score": 1.5},
+            }
+            for i in range(3)
+        ]
+        manager.legacy_entries_file.write_text(json.dumps(legacy))
+
+        assert [e.id for e in manager.entries] == ["e0", "e1", "e2"]
+        assert manager.entries[0].context == {"score": 1.5}
+        assert manager.entries_file.exists()
+
+        # A fresh manager reads the migrated file
+        assert [e.id for e in manager_factory().entries] == ["e0", "e1", "e2"]
+
+    def test_legacy_migration_keeps_newest(self, manager_factory):
+        """Migration keeps only the newest max_entries entries."""
+        manager = manager_factory()
+        manager.max_entries = 2
+        legacy = [
+            {"id": f"e{i}", "timestamp": "t", "type": "error", "content": "c"}
+            for i in range(5)
+        ]
+        manager.legacy_entries_file.write_text(json.dumps(legacy))
+
+        assert [e.id for e in manager.entries] == ["e3", "e4"]
+
+    def test_corrupt_legacy_file(self, manager_factory):
+        """A truncated legacy file yields no entries instead of raising."""
+        manager = manager_factory()
+        manager.legacy_entries_file.write_text('[{"id": "e0", "timestamp"')
+
+        assert manager.entries == []
+
+
+class TestMemoryIndexRecovery:
+    """Tests for index durability when deferred flushes never happen."""
+
+    @pytest.fixture
+    def manager_factory(self, tmp_path, monkeypatch):
+        settings = types.SimpleNamespace(data_dir=tmp_path / "data")
+        monkeypatch.setattr(memory, "get_settings", lambda: settings)
+        project = tmp_path / "project"
+        project.mkdir()
+        return lambda: memory.MemoryManager(project)
+
+    def test_entries_indexed_after_hard_exit(self, tmp_path, manager_factory):
+        """Entries written before a crash are searchable after a restart."""
+        script = textwrap.dedent("""
+            import os, sys, types
+            from pathlib import Path
+            from src.core import memory
+
+            settings = types.SimpleNamespace(data_dir=Path(sys.argv[1]))
+            memory.get_settings = lambda: settings
+            manager = memory.MemoryManager(Path(sys.argv[2]))
+            manager.index_flush_interval = 3600
+            manager.remember("zebra crossing")
+            manager.flush()
+            manager.remember("zebra stripes")
+            manager.remember("lion mane")
+            os._exit(0)  # No atexit flush, as after a crash or SIGKILL
+        """)
+        subprocess.run(
+            [sys.executable, "-c", script, str(tmp_path / "data"), str(tmp_path / "project")],
+            cwd=REPO_ROOT, check=True,
+        )
+
+        manager = manager_factory()
+        assert len(manager.entries) == 3
+        assert [e.content for e in manager.recall("zebra")] == ["zebra crossing", "zebra stripes"]
+        assert [e.content for e in manager.recall("lion")] == ["lion mane"]
+
+        # The reconciled index is saved with a mark covering every entry
+        manager.flush()
+        saved = json.loads(manager.index_file.read_text())
+        assert saved["indexed_through"] == manager.entries[-1].id
+
+    def test_queued_entries_indexed_after_hard_exit(self, tmp_path, manager_factory):
+        """Entries still queued for the background indexer survive a crash."""
+        script = textwrap.dedent("""
+            import os, sys, types
+            from pathlib import Path
+            from src.core import memory
+
+            settings = types.SimpleNamespace(data_dir=Path(sys.argv[1]))
+            memory.get_settings = lambda: settings
+            manager = memory.MemoryManager(Path(sys.argv[2]))
+            with manager._index_lock:  # Hold the indexer off the queue
+                manager.remember("zebra crossing")
+                manager.remember("zebra stripes")
+                os._exit(0)
+        """)
+        subprocess.run(
+            [sys.executable, "-c", script, str(tmp_path / "data"), str(tmp_path / "project")],
+            cwd=REPO_ROOT, check=True,
+        )
+
+        manager = manager_factory()
+        assert not manager.index_file.exists()
+        assert [e.content for e in manager.recall("zebra")] == ["zebra crossing", "zebra stripes"]
+
+    def test_unmarked_index_rebuilt(self, manager_factory):
+        """An index saved in the old keyword-only format is rebuilt."""
+        manager = manager_factory()
+        entry = {"id": "e0", "timestamp": "t", "type": "error", "content": "zebra"}
+        manager.entries_file.write_text(json.dumps(entry) + "\n")
+        manager.index_file.write_text(json.dumps({"other": ["gone"]}))
+
+        assert [e.id for e in manager.recall("zebra")] == ["e0"]
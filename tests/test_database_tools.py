@@ -0,0 +1,79 @@
+"""Tests for database tools."""
+
+import pytest
+
+from src.core.database_tools import DatabaseTools, _is_read_statement
+
+
+@pytest.fixture
+def db(tmp_path):
+    tools = DatabaseTools(tmp_path / "store")
+    tools.add_connection("test", "sqlite", str(tmp_path / "test.db"))
+    tools.connect("test")
+    tools.query("CREATE TABLE t (a INTEGER)")
+    tools.query("INSERT INTO t VALUES (1), (2), (3)")
+    return tools
+
+
+class TestReadStatements:
+    """Tests for read statement detection."""
+
+    @pytest.mark.parametrize("sql", [
+        "SELECT 1",
+        "  select * from t",
+        "PRAGMA table_info(t)",
+        "EXPLAIN SELECT 1",
+    ])
+    def test_reads(self, sql):
+        assert _is_read_statement(sql)
+
+    @pytest.mark.parametrize("sql", [
+        "INSERT INTO t VALUES (1)",
+        "DELETE FROM t",
+        "WITH c AS (SELECT 1) DELETE FROM t",
+    ])
+    def test_writes(self, sql):
+        assert not _is_read_statement(sql)
+
+
+class TestQuery:
+    """Tests for query results."""
+
+    def test_select_rows(self, db):
+        result = db.query("SELECT a FROM t ORDER BY a")
+        assert result.success
+        assert result.rows == [{"a": 1}, {"a": 2}, {"a": 3}]
+        assert result.affected_rows == 0
+
+    def test_dml_affected_rows(self, db):
+        result = db.query("UPDATE t SET a = a + 10 WHERE a > 1")
+        assert result.success
+        assert result.affected_rows == 2
+
+    def test_with_delete_affected_rows(self, db):
+        """DML behind a CTE reports its row count and is committed."""
+        result = db.query("WITH c AS (SELECT 1 AS v) DELETE FROM t WHERE a IN (SELECT v FROM c)")
+        assert result.success
+        assert result.affected_rows == 1
+        assert db.query("SELECT a FROM t ORDER BY a").rows == [{"a": 2}, {"a": 3}]
+
+    def test_with_update_affected_rows(self, db):
+        result = db.query(
+            "WITH c AS (SELECT a FROM t WHERE a > 1) "
+            "UPDATE t SET a = 0 WHERE a IN (SELECT a FROM c)"
+        )
+        assert result.success
+        assert result.affected_rows == 2
+
+    def test_with_select_rows(self, db):
+        """A CTE that only selects returns rows and changes nothing."""
+        result = db.query("WITH c AS (SELECT a FROM t WHERE a > 2) SELECT a FROM c")
+        assert result.success
+        assert result.rows == [{"a": 3}]
+        assert result.affected_rows == 0
+
+    def test_insert_returning(self, db):
+        result = db.query("INSERT INTO t VALUES (5) RETURNING a")
+        assert result.success
+        assert result.rows == [{"a": 5}]
+        assert result.affected_rows == 1
@@ -0,0 +1,165 @@
+"""Tests for the diff preview system."""
+
+import pytest
+
+from src.core import diff_preview
+from src.core.diff_preview import DiffPreview
+
+
+@pytest.fixture
+def preview():
+    return DiffPreview()
+
+
+class TestFormatDiff:
+    """Tests for diff display formatting."""
+
+    def test_plain_output(self, preview):
+        diff = preview.create_diff("app.py", "a\nb\nc\n", "a\nB\nc\n")
+        assert preview.format_diff(diff, color=False) == (
+            "[MODIFIED] app.py\n"
+            "\n"
+            "--- Hunk 1/1 ---\n"
+            "@@ -1,3 +1,3 @@\n"
+            "   a\n"
+            "-b\n"
+            "+B\n"
+            "   c\n"
+        )
+
+    def test_colored_output(self, preview):
+        diff = preview.create_diff("app.py", "a\nb\n", "a\nc\n")
+        lines = list(preview._iter_diff_lines(diff, color=True))
+        assert lines[0] == "[yellow][MODIFIED][/yellow] app.py"
+        assert "[red]-b[/red]" in lines
+        assert "[green]+c[/green]" in lines
+
+    def test_blank_context_lines(self, preview):
+        """Whitespace-only context lines are shown empty."""
+        diff = preview.create_diff("app.py", "a\n  \nb\n", "a\n  \nc\n")
+        assert list(preview._iter_diff_lines(diff, color=False))[4:] == ["   a", "", "-b", "+c"]
+
+    def test_no_hunks(self, preview):
+        diff = preview.create_diff("app.py", "same\n", "same\n")
+        assert preview.format_diff(diff, color=False) == "[MODIFIED] app.py\n"
+
+
+class TestCreateDiff:
+    """Tests for building hunks."""
+
+    @pytest.fixture
+    def no_difflib(self, monkeypatch):
+        def fail(*args, **kwargs):
+            pytest.fail("unified_diff called")
+        monkeypatch.setattr(diff_preview.difflib, "unified_diff", fail)
+
+    def test_unchanged(self, preview, no_difflib):
+        diff = preview.create_diff("app.py", "x\n", "x\n")
+        assert diff.hunks == []
+        assert not diff.is_new_file and not diff.is_deleted
+
+    def test_new_file(self, preview, no_difflib):
+        diff = preview.create_diff("app.py", "", "a\nb")
+        assert diff.is_new_file
+        [hunk] = diff.hunks
+        assert (hunk.start_old, hunk.count_old, hunk.start_new, hunk.count_new) == (0, 0, 1, 2)
+        assert hunk.lines == ["+a\n", "+b"]
+
+    def test_deleted_file(self, preview, no_difflib):
+        diff = preview.create_diff("app.py", "a\nb\n", "")
+        assert diff.is_deleted
+        [hunk] = diff.hunks
+        assert (hunk.start_old, hunk.count_old, hunk.start_new, hunk.count_new) == (1, 2, 0, 0)
+        assert hunk.lines == ["-a\n", "-b\n"]
+
+
+class TestParseHunks:
+    """Tests for parsing unified diff text."""
+
+    def test_header_counts(self, preview):
+        """Omitted counts default to one; malformed headers are skipped."""
+        hunks = preview._parse_hunks([
+            "--- a/f\n", "+++ b/f\n",
+            "@@ -3 +3,2 @@\n", "-x\n", "+y\n", "+z\n",
+            "@@ bogus @@\n",
+            "@@ -10,0 +12 @@ def f():\n", "+w\n",
+        ])
+        assert [(h.start_old, h.count_old, h.start_new, h.count_new) for h in hunks] == [
+            (3, 1, 3, 2), (10, 0, 12, 1),
+        ]
+        assert hunks[0].lines == ["-x\n", "+y\n", "+z\n"]
+        assert hunks[1].lines == ["+w\n"]
+
+
+    def test_body_lines_like_file_headers(self, preview):
+        """Removed or added lines starting with -- or ++ stay in the hunk."""
+        diff = preview.create_diff("notes.md", "title\n-- old\nend\n", "title\n++ new\nend\n")
+        [hunk] = diff.hunks
+        assert hunk.lines == [" title\n", "--- old\n", "+++ new\n", " end\n"]
+
+
+class TestInlineDiff:
+    """Tests for word-level inline diffs with either opcode backend."""
+
+    @pytest.fixture(params=[True, False], ids=["rapidfuzz", "difflib"])
+    def inline(self, request, preview, monkeypatch):
+        if request.param and diff_preview.Levenshtein is None:
+            pytest.skip("rapidfuzz not installed")
+        monkeypatch.setattr(diff_preview, "RAPIDFUZZ_AVAILABLE", request.param)
+        return preview.format_inline_diff
+
+    @pytest.mark.parametrize("old, new, expected", [
+        ("a b c", "a b c", "a b c"),
+        ("a b c", "a x c", "a [red][-b-][/red] [green][+x+][/green] c"),
+        ("a b c", "a b c d", "a b c [green][+d+][/green]"),
+        ("a b c", "b c", "[red][-a-][/red] b c"),
+        (
+            "the quick brown fox",
+            "the slow red fox",
+            "the [red][-quick brown-][/red] [green][+slow red+][/green] fox",
+        ),
+        ("", "", ""),
+    ])
+    def test_inline_diff(self, inline, old, new, expected):
+        assert inline(old, new) == expected
+
+
+class TestPendingChanges:
+    """Tests for queued changes."""
+
+    def test_latest_change_per_file(self, preview):
+        """A newer diff for the same file replaces the queued one."""
+        preview.add_pending_change(preview.create_diff("a.py", "", "1"))
+        preview.add_pending_change(preview.create_diff("b.py", "", "2"))
+        preview.add_pending_change(preview.create_diff("a.py", "", "3"))
+
+        pending = preview.get_pending_changes()
+        assert [(d.file_path, d.new_content) for d in pending] == [("b.py", "2"), ("a.py", "3")]
+
+        preview.clear_pending()
+        assert preview.get_pending_changes() == []
+
+    def test_apply_all_pending(self, preview, tmp_path, monkeypatch):
+        """Files are written, parents created once each and deletions applied."""
+        old_file = tmp_path / "old.txt"
+        old_file.write_text("bye\n")
+        for name in ("pkg/a.py", "pkg/b.py", "pkg/sub/c.py"):
+            preview.add_pending_change(preview.create_diff(str(tmp_path / name), "", name))
+        preview.add_pending_change(preview.create_diff(str(old_file), "bye\n", ""))
+
+        parent_flags = []
+        original_apply = preview.apply_change
+
+        def apply_change(file_diff, create_parents=True):
+            parent_flags.append(create_parents)
+            return original_apply(file_diff, create_parents)
+
+        monkeypatch.setattr(preview, "apply_change", apply_change)
+        results = preview.apply_all_pending()
+
+        assert [r["action"] for r in results] == ["written", "written", "written", "deleted"]
+        assert (tmp_path / "pkg" / "sub" / "c.py").read_text() == "pkg/sub/c.py"
+        assert not old_file.exists()
+        # Parents were created up front, not again per file
+        assert parent_flags == [False, False, False, False]
+        assert preview.get_pending_changes() == []
@@ -0,0 +1,138 @@
+"""Tests for the documentation generator."""
+
+import os
+
+import pytest
+
+from src.core import doc_generator
+from src.core.doc_generator import DocGenerator
+
+SOURCE = '''"""Demo module."""
+
+import os
+
+LIMIT = 10
+
+
+class Greeter:
+    """Says hello."""
+
+    def greet(self, name: str) -> str:
+        return f"hi {name}"
+
+
+def add(a: int, b: int = 1) -> int:
+    """Add numbers."""
+    return a + b
+'''
+
+
+@pytest.fixture
+def module(tmp_path):
+    path = tmp_path / "demo.py"
+    path.write_text(SOURCE)
+    return path
+
+
+@pytest.fixture
+def parses(monkeypatch):
+    """Count ast.parse calls made while generating docs."""
+    calls = []
+    original = doc_generator.ast.parse
+
+    def parse(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(doc_generator.ast, "parse", parse)
+    return calls
+
+
+class TestMemoryCache:
+    """Tests for the in-process module doc cache."""
+
+    def test_unchanged_file_parsed_once(self, module, parses):
+        generator = DocGenerator(module.parent)
+        first = generator.generate_module_doc(str(module))
+        second = generator.generate_module_doc(str(module))
+
+        assert len(parses) == 1
+        assert second == first
+        assert [f.name for f in first.functions] == ["add"]
+        assert [c.name for c in first.classes] == ["Greeter"]
+
+    def test_results_are_copies(self, module):
+        generator = DocGenerator(module.parent)
+        doc = generator.generate_module_doc(str(module))
+        doc.functions.clear()
+        doc.classes[0].methods.clear()
+
+        again = generator.generate_module_doc(str(module))
+        assert [f.name for f in again.functions] == ["add"]
+        assert [m.name for m in again.classes[0].methods] == ["greet"]
+
+    def test_invalidated_on_change(self, module, parses):
+        generator = DocGenerator(module.parent)
+        generator.generate_module_doc(str(module))
+
+        module.write_text(SOURCE + "\n\ndef sub(a, b):\n    return a - b\n")
+        stat = module.stat()
+        os.utime(module, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+
+        doc = generator.generate_module_doc(str(module))
+        assert len(parses) == 2
+        assert [f.name for f in doc.functions] == ["add", "sub"]
+
+    def test_cache_disabled(self, module, parses):
+        generator = DocGenerator(module.parent, cache=False)
+        generator.generate_module_doc(str(module))
+        generator.generate_module_doc(str(module))
+        assert len(parses) == 2
+
+
+class TestDiskCache:
+    """Tests for the opt-in JSON module doc cache."""
+
+    def test_off_by_default(self, module, tmp_path):
+        DocGenerator(module.parent).generate_module_doc(str(module))
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["demo.py"]
+
+    def test_shared_across_generators(self, module, tmp_path, parses):
+        cache_dir = tmp_path / "cache"
+        first = DocGenerator(module.parent, cache_dir=cache_dir).generate_module_doc(str(module))
+        [entry] = cache_dir.iterdir()
+        assert entry.suffix == ".json"
+
+        # A fresh generator has an empty memory cache but reads the JSON entry
+        second = DocGenerator(module.parent, cache_dir=cache_dir).generate_module_doc(str(module))
+        assert len(parses) == 1
+        assert second == first
+
+    def test_corrupt_entry_reparsed(self, module, tmp_path, parses):
+        cache_dir = tmp_path / "cache"
+        DocGenerator(module.parent, cache_dir=cache_dir).generate_module_doc(str(module))
+        [entry] = cache_dir.iterdir()
+        entry.write_text("{not json")
+
+        doc = DocGenerator(module.parent, cache_dir=cache_dir).generate_module_doc(str(module))
+        assert len(parses) == 2
+        assert [f.name for f in doc.functions] == ["add"]
+
+    def test_pruned_to_limit(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(doc_generator, "_DOC_CACHE_MAX_FILES", 2)
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        for i in range(3):
+            stale = cache_dir / f"stale{i}.json"
+            stale.write_text("{}")
+            os.utime(stale, ns=(i, i))
+
+        module = tmp_path / "demo.py"
+        module.write_text(SOURCE)
+        DocGenerator(tmp_path, cache_dir=cache_dir).generate_module_doc(str(module))
+
+        # The oldest entries go; the one just written stays
+        remaining = sorted(p.name for p in cache_dir.iterdir())
+        assert len(remaining) == 2
+        assert "stale2.json" in remaining
+        assert not all(name.startswith("stale") for name in remaining)
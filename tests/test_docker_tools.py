@@ -0,0 +1,82 @@
+"""Tests for Docker tools."""
+
+import json
+
+import pytest
+
+from src.core.docker_tools import DockerResult, DockerTools
+
+
+class FakeDocker:
+    """Stands in for DockerTools._run_docker and records each call."""
+
+    def __init__(self, outputs):
+        self.outputs = outputs
+        self.calls = []
+
+    def __call__(self, args, timeout=60, working_dir=None):
+        self.calls.append(args)
+        output = self.outputs.get(args[0])
+        if output is None:
+            return DockerResult(success=False, error="daemon not running")
+        return DockerResult(success=True, output=output)
+
+
+IMAGE = {"ID": "sha256:abcdef123456", "Repository": "app", "Tag": "latest",
+         "Size": "10MB", "CreatedAt": "2024-01-01"}
+
+
+@pytest.fixture
+def docker(tmp_path):
+    tools = DockerTools(tmp_path)
+    fake = FakeDocker({
+        "images": json.dumps(IMAGE),
+        "info": json.dumps({"ServerVersion": "27.0"}),
+        "stop": "",
+    })
+    tools._run_docker = fake
+    return tools, fake
+
+
+class TestQueryCache:
+    """Tests for the short-lived query cache."""
+
+    def test_repeat_queries_cached(self, docker):
+        tools, fake = docker
+        assert [i.repository for i in tools.list_images()] == ["app"]
+        assert [i.repository for i in tools.list_images()] == ["app"]
+        assert tools.get_info() == {"ServerVersion": "27.0"}
+        assert tools.get_info() == {"ServerVersion": "27.0"}
+        assert [args[0] for args in fake.calls] == ["images", "info"]
+
+    def test_results_are_copies(self, docker):
+        tools, _ = docker
+        tools.list_images().clear()
+        tools.get_info()["ServerVersion"] = "changed"
+
+        assert len(tools.list_images()) == 1
+        assert tools.get_info() == {"ServerVersion": "27.0"}
+
+    def test_ttl_expiry(self, docker):
+        tools, fake = docker
+        tools._cache_ttl = 0
+        tools.list_images()
+        tools.list_images()
+        assert len(fake.calls) == 2
+
+    def test_mutation_invalidates(self, docker):
+        tools, fake = docker
+        tools.list_images()
+        tools.stop("web")
+        tools.list_images()
+        assert [args[0] for args in fake.calls] == ["images", "stop", "images"]
+
+    def test_failures_not_cached(self, docker):
+        """A failed query is retried on the next call."""
+        tools, fake = docker
+        fake.outputs.pop("info")
+        assert tools.get_info() == {}
+
+        fake.outputs["info"] = json.dumps({"ServerVersion": "27.0"})
+        assert tools.get_info() == {"ServerVersion": "27.0"}
+        assert len(fake.calls) == 2
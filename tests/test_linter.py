@@ -0,0 +1,165 @@
+"""Tests for the linter integration."""
+
+import asyncio
+import json
+import sys
+
+import pytest
+
+from src.core.linter import IssueSeverity, LinterIntegration, LinterType, LintResult
+
+RUFF_REPORT = [{
+    "filename": "app.py",
+    "location": {"row": 3, "column": 1},
+    "code": "F401",
+    "message": "`os` imported but unused",
+    "fix": {"applicability": "safe"},
+}]
+
+
+@pytest.fixture
+def make_tree(tmp_path):
+    def make(*paths):
+        for rel in paths:
+            path = tmp_path / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("")
+        return LinterIntegration(tmp_path)
+    return make
+
+
+class TestSourceExtensions:
+    """Tests for detecting project languages."""
+
+    def test_finds_extensions(self, make_tree):
+        linter = make_tree("app.py", "web/main.ts", "cmd/tool.go")
+        assert linter._find_source_extensions() == {".py", ".ts", ".go"}
+
+    def test_skips_ignored_and_hidden_dirs(self, make_tree):
+        """Vendored, build and hidden directories do not count."""
+        linter = make_tree(
+            "app.py",
+            "node_modules/pkg/index.js",
+            "build/gen.go",
+            ".cache/tool.ts",
+        )
+        assert linter._find_source_extensions() == {".py"}
+
+
+class TestProjectLinters:
+    """Tests for the shared project linter recommendation."""
+
+    @pytest.fixture
+    def bin_dir(self, tmp_path, monkeypatch):
+        """An empty directory that is the whole PATH."""
+        path = tmp_path / "bin"
+        path.mkdir()
+        monkeypatch.setenv("PATH", str(path))
+        return path
+
+    def add_command(self, bin_dir, name):
+        command = bin_dir / name
+        command.write_text("#!/bin/sh\n")
+        command.chmod(0o755)
+
+    def test_shared_across_instances(self, make_tree, bin_dir, monkeypatch):
+        self.add_command(bin_dir, "ruff")
+        first = make_tree("app.py")
+        assert first.detect_project_linters() == [LinterType.RUFF]
+
+        # A second instance reuses the answer without walking the tree
+        second = LinterIntegration(first.working_dir)
+        monkeypatch.setattr(second, "_find_source_extensions", lambda: pytest.fail("walked"))
+        assert second.detect_project_linters() == [LinterType.RUFF]
+
+    def test_recomputed_when_path_changes(self, make_tree, bin_dir, monkeypatch):
+        linter = make_tree("app.py")
+        assert linter.detect_project_linters() == []
+
+        other_bin = bin_dir.parent / "other-bin"
+        other_bin.mkdir()
+        self.add_command(other_bin, "flake8")
+        monkeypatch.setenv("PATH", str(other_bin))
+        assert LinterIntegration(linter.working_dir).detect_project_linters() == [LinterType.FLAKE8]
+
+
+class TestLintMany:
+    """Tests for running several linters concurrently."""
+
+    @pytest.fixture
+    def linter(self, tmp_path, monkeypatch):
+        """A LinterIntegration whose linters are small Python scripts."""
+        scripts = {
+            LinterType.RUFF: f"import sys; sys.stdout.write({json.dumps(RUFF_REPORT)!r})",
+            LinterType.MYPY: "print('app.py:7: error: Incompatible types  [assignment]')",
+        }
+
+        def build_command(linter_type, path, fix):
+            if linter_type not in scripts:
+                return ["no-such-linter-binary"]
+            return [sys.executable, "-c", scripts[linter_type]]
+
+        integration = LinterIntegration(tmp_path)
+        monkeypatch.setattr(integration, "_build_command", build_command)
+        return integration
+
+    def test_results_in_given_order(self, linter):
+        results = asyncio.run(linter.lint_many([LinterType.MYPY, LinterType.RUFF]))
+        assert [r.linter for r in results] == ["mypy", "ruff"]
+        assert all(r.success for r in results)
+
+        mypy, ruff = results
+        assert [(i.file_path, i.line, i.message) for i in mypy.issues] == [
+            ("app.py", 7, "Incompatible types  [assignment]"),
+        ]
+        assert [(i.code, i.line, i.fixable) for i in ruff.issues] == [("F401", 3, True)]
+
+    def test_missing_linter(self, linter):
+        """A linter that is not installed fails alone."""
+        ruff, eslint = linter.lint_all([LinterType.RUFF, LinterType.ESLINT])
+        assert ruff.success
+        assert not eslint.success
+        assert "not found" in eslint.message
+
+
+class TestCollectIssues:
+    """Tests for parsing raw linter output."""
+
+    def collect(self, linter_type, output):
+        result = LintResult(linter=linter_type.value, success=True)
+        LinterIntegration()._collect_issues(result, linter_type, output)
+        return result
+
+    def test_ruff_json_bytes(self):
+        result = self.collect(LinterType.RUFF, json.dumps(RUFF_REPORT).encode())
+        assert [(i.file_path, i.code, i.severity) for i in result.issues] == [
+            ("app.py", "F401", IssueSeverity.WARNING),
+        ]
+        assert (result.error_count, result.warning_count) == (0, 1)
+
+    def test_eslint_json_bytes(self):
+        report = [{"filePath": "/src/a.js", "messages": [
+            {"line": 1, "column": 5, "ruleId": "no-undef", "message": "x", "severity": 2},
+            {"line": 2, "column": 1, "ruleId": "semi", "message": "y", "severity": 1},
+        ]}]
+        result = self.collect(LinterType.ESLINT, json.dumps(report).encode())
+        assert [i.code for i in result.issues] == ["no-undef", "semi"]
+        assert (result.error_count, result.warning_count) == (1, 1)
+
+    def test_mypy_text_with_invalid_utf8(self):
+        """Line-oriented output is decoded leniently."""
+        output = b"app.py:3: error: Bad \xff type\napp.py:4: note: See here\n"
+        result = self.collect(LinterType.MYPY, output)
+        assert [i.line for i in result.issues] == [3, 4]
+        assert (result.error_count, result.info_count) == (1, 1)
+
+    def test_generic_patterns(self):
+        output = b"a.c:10:4: warning: unused\nb.c(7): bad thing\nnoise\n"
+        result = self.collect(LinterType.FLAKE8, output)
+        assert [(i.file_path, i.line, i.column) for i in result.issues] == [
+            ("a.c", 10, 4), ("b.c", 7, 0),
+        ]
+
+    @pytest.mark.parametrize("output", [b"", b"   ", b"not json"])
+    def test_unparsable_json(self, output):
+        assert self.collect(LinterType.RUFF, output).issues == []
@@ -0,0 +1,180 @@
+"""Tests for the metrics dashboard."""
+
+import json
+import os
+
+import pytest
+
+from src.core import metrics_dashboard
+from src.core.metrics_dashboard import MetricsDashboard
+
+
+@pytest.fixture
+def dashboard(tmp_path):
+    return MetricsDashboard(tmp_path, cache=False)
+
+
+class TestLineCounts:
+    """Tests for per-file line type counts."""
+
+    def test_python_line_types(self, dashboard, tmp_path):
+        """Code, comment and blank lines add up to the total."""
+        source = tmp_path / "app.py"
+        source.write_text("# header\n\nimport os\n   \n    # indented\nx = 1\n")
+
+        metrics = dashboard._analyze_file(source)
+        assert metrics.lines_total == 6
+        assert metrics.lines_blank == 2
+        assert metrics.lines_comments == 2
+        assert metrics.lines_code == 2
+
+    def test_unterminated_last_line(self, dashboard, tmp_path):
+        """A last line without a newline still counts."""
+        source = tmp_path / "app.py"
+        source.write_text("x = 1\n  ")
+
+        metrics = dashboard._analyze_file(source)
+        assert metrics.lines_total == 2
+        assert metrics.lines_blank == 1
+
+    def test_crlf_newlines(self, dashboard, tmp_path):
+        """CRLF and lone CR end lines like LF."""
+        source = tmp_path / "app.py"
+        source.write_bytes(b"x = 1\r\n\r\ny = 2\rz = 3\r\n")
+
+        metrics = dashboard._analyze_file(source)
+        assert metrics.lines_total == 4
+        assert metrics.lines_blank == 1
+
+    def test_only_newline_ends_lines(self, dashboard, tmp_path):
+        """Vertical tabs and form feeds do not split lines."""
+        source = tmp_path / "app.py"
+        source.write_text("a\x0bb\n c\n\x0c\n")
+
+        metrics = dashboard._analyze_file(source)
+        assert metrics.lines_total == 3
+        assert metrics.lines_blank == 1
+        assert metrics.lines_code == 2
+
+
+class TestCommentPrefixes:
+    """Tests for comment line detection by language."""
+
+    @pytest.mark.parametrize("name, source, comments", [
+        ("app.py", '# a\nx = 1  # not a comment line\n    """doc\n', 2),
+        ("app.js", "// a\n/* b\n * c\n */\nlet x = 1;\n", 4),
+        ("q.sql", "-- a\n/* b\nSELECT 1;\n", 2),
+        ("page.html", "<!-- a\n<p>hi</p>\n", 1),
+        ("tool.rb", "=begin\n# a\nputs 1\n", 2),
+        ("notes.md", "# Title\ntext\n", 0),
+    ])
+    def test_comment_lines(self, dashboard, tmp_path, name, source, comments):
+        path = tmp_path / name
+        path.write_text(source)
+
+        metrics = dashboard._analyze_file(path)
+        assert metrics.lines_comments == comments
+        assert metrics.lines_code == metrics.lines_total - metrics.lines_blank - comments
+
+
+class TestMetricsCache:
+    """Tests for the per-file metrics cache."""
+
+    @pytest.fixture
+    def project(self, tmp_path):
+        (tmp_path / "a.py").write_text("import os\n")
+        (tmp_path / "b.py").write_text("x = 1\n\n# note\n")
+        return tmp_path
+
+    @pytest.fixture
+    def analyzed(self, monkeypatch):
+        """Names of files analyzed (not served from the cache)."""
+        names = []
+        original = MetricsDashboard._analyze_files
+
+        def analyze_files(self, paths):
+            names.extend(sorted(path.name for path in paths))
+            return original(self, paths)
+
+        monkeypatch.setattr(MetricsDashboard, "_analyze_files", analyze_files)
+        return names
+
+    def summary(self, metrics):
+        return sorted((f.path, f.lines_total, f.lines_comments) for f in metrics.files)
+
+    def test_unchanged_files_reused(self, project, analyzed):
+        first = MetricsDashboard(project).analyze()
+        second = MetricsDashboard(project).analyze()
+
+        assert analyzed == ["a.py", "b.py"]
+        assert self.summary(second) == self.summary(first)
+        assert second.total_lines == first.total_lines == 4
+
+    def test_changed_file_reanalyzed(self, project, analyzed):
+        MetricsDashboard(project).analyze()
+
+        changed = project / "b.py"
+        changed.write_text("x = 1\ny = 2\n# one\n# two\n")
+        stat = changed.stat()
+        os.utime(changed, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+        metrics = MetricsDashboard(project).analyze()
+
+        assert analyzed == ["a.py", "b.py", "b.py"]
+        assert ("b.py", 4, 2) in self.summary(metrics)
+
+    def test_removed_file_dropped(self, project):
+        MetricsDashboard(project).analyze()
+        (project / "a.py").unlink()
+        metrics = MetricsDashboard(project).analyze()
+
+        assert [f.path for f in metrics.files] == ["b.py"]
+        data = json.loads((project / MetricsDashboard.CACHE_FILE).read_text())
+        assert len(data["files"]) == 1
+
+    def test_stale_version_ignored(self, project, analyzed):
+        MetricsDashboard(project).analyze()
+        cache_file = project / MetricsDashboard.CACHE_FILE
+        data = json.loads(cache_file.read_text())
+        data["version"] = metrics_dashboard._METRICS_CACHE_VERSION - 1
+        cache_file.write_text(json.dumps(data))
+
+        MetricsDashboard(project).analyze()
+        assert analyzed == ["a.py", "b.py", "a.py", "b.py"]
+
+    def test_cache_disabled(self, project):
+        MetricsDashboard(project, cache=False).analyze()
+        assert not (project / MetricsDashboard.CACHE_FILE).exists()
+
+
+class TestProcessPool:
+    """Tests for analyzing large trees in worker processes."""
+
+    @pytest.fixture
+    def project(self, tmp_path):
+        for i in range(6):
+            (tmp_path / f"m{i}.py").write_text("# c\n" * i + "x = 1\n\n")
+        return tmp_path
+
+    def summary(self, metrics):
+        return sorted(
+            (f.path, f.lines_total, f.lines_comments, f.lines_blank) for f in metrics.files
+        )
+
+    def test_matches_serial(self, project):
+        serial = MetricsDashboard(project, cache=False)
+        parallel = MetricsDashboard(project, cache=False)
+        parallel.PARALLEL_MIN_FILES = 2
+
+        assert self.summary(parallel.analyze()) == self.summary(serial.analyze())
+
+    def test_falls_back_without_workers(self, project, monkeypatch):
+        def no_workers(*args, **kwargs):
+            raise OSError("no processes")
+
+        monkeypatch.setattr(metrics_dashboard, "ProcessPoolExecutor", no_workers)
+        dashboard = MetricsDashboard(project, cache=False)
+        dashboard.PARALLEL_MIN_FILES = 2
+
+        metrics = dashboard.analyze()
+        assert len(metrics.files) == 6
+        assert metrics.total_lines == sum(i + 2 for i in range(6))